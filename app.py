@@ -1,21 +1,74 @@
 """
 Main entry point for Streamlit Cloud deployment.
-This file imports and runs the portfolio app from the streamlit-portfolio directory.
+
+``streamlit run app.py`` executes this file as ``__main__`` on every rerun and
+it delegates to the portfolio app in ``streamlit-portfolio/src``. Importing it
+has no side effects, so it can also be imported for warm-up, tests or
+pre-forking:
+
+    import app
+    app.warm_up()   # parse data, minify CSS and import page modules up front
+
+``python app.py`` warms up this process and then starts the Streamlit server in
+it, so the first session is served warm.
 """
+from __future__ import annotations
+
+import importlib.util
 import sys
 from pathlib import Path
+from types import ModuleType
+
+
+PORTFOLIO_SRC = Path(__file__).resolve().parent / "streamlit-portfolio" / "src"
+
+# The portfolio's own app.py is loaded under this name so it never shadows this module.
+_MODULE_NAME = "portfolio_app"
+
+
+def load_portfolio_app() -> ModuleType:
+    """Import ``streamlit-portfolio/src/app.py`` once per process and return it."""
+    module = sys.modules.get(_MODULE_NAME)
+    if module is not None:
+        return module
+
+    # The portfolio app imports its `components` and `styles` packages from src/.
+    if str(PORTFOLIO_SRC) not in sys.path:
+        sys.path.insert(0, str(PORTFOLIO_SRC))
+    spec = importlib.util.spec_from_file_location(_MODULE_NAME, PORTFOLIO_SRC / "app.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[_MODULE_NAME] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[_MODULE_NAME]
+        raise
+    return module
+
+
+def warm_up() -> None:
+    """Pre-load data, the stylesheet and heavy modules into this process."""
+    load_portfolio_app().warm_up()
+
+
+def main() -> None:
+    load_portfolio_app().main()
+
+
+def _serve(argv: list[str]) -> None:
+    from streamlit.web import cli
+
+    warm_up()
+    # Same as `streamlit run app.py <argv>`, but in this already warm process.
+    sys.argv = ["streamlit", "run", str(Path(__file__).resolve()), *argv]
+    sys.exit(cli.main())
 
-def main():
-    # Add the streamlit-portfolio/src directory to Python path
-    portfolio_src = Path(__file__).parent / "streamlit-portfolio" / "src"
-    sys.path.insert(0, str(portfolio_src))
-    
-    # Import and run the portfolio app
-    from app import main as portfolio_main
-    portfolio_main()
 
 if __name__ == "__main__":
-    main()
-else:
-    # For Streamlit Cloud, run automatically
-    main()
\ No newline at end of file
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    if get_script_run_ctx() is not None:
+        # Executed by the Streamlit script runner (`streamlit run app.py`).
+        main()
+    else:
+        _serve(sys.argv[1:])
@@ -0,0 +1,26 @@
+"""Helpers for measuring the element tree produced by an ``AppTest`` run."""
+from __future__ import annotations
+
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.element_tree import Block
+
+
+def tree_stats(at: AppTest) -> tuple[int, int]:
+    """Return ``(element_count, serialized_bytes)`` for the last run of *at*.
+
+    The byte count sums the protobuf size of every element and block, which is
+    what the server serializes into deltas for the browser on a full rerun.
+    """
+    elements = 0
+    size = 0
+    pending = [at._tree]
+    while pending:
+        node = pending.pop()
+        proto = getattr(node, "proto", None)
+        if proto is not None:
+            size += proto.ByteSize()
+        if isinstance(node, Block):
+            pending.extend(node.children.values())
+        else:
+            elements += 1
+    return elements, size
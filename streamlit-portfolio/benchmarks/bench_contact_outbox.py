@@ -0,0 +1,122 @@
+"""Contact submit latency with a slow mail relay: inline SMTP versus the outbox.
+
+Starts a minimal local SMTP server that sleeps before accepting each message,
+then submits from several threads at once, the way concurrent sessions would.
+"inline" sends over SMTP inside the submit call; "outbox" only enqueues and
+lets the background worker deliver. The run ends once the worker has drained
+the queue, so the delivered count shows nothing was lost.
+
+Run from the ``streamlit-portfolio`` directory::
+
+    python benchmarks/bench_contact_outbox.py --submits 200 --threads 8 --delay 0.2
+"""
+from __future__ import annotations
+
+import argparse
+import socketserver
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from components.outbox import Outbox, OutboxMessage, SMTPSender  # noqa: E402
+
+
+class _SlowSMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: accepts every message after ``server.delay`` seconds."""
+
+    def _reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode("ascii"))
+
+    def handle(self) -> None:
+        self._reply("220 fake-smtp ready")
+        for raw in self.rfile:
+            command = raw.decode("ascii", "replace").strip().upper()
+            if command.startswith("EHLO"):
+                self._reply("250 fake-smtp")
+            elif command.startswith("DATA"):
+                self._reply("354 end with <CRLF>.<CRLF>")
+                for line in self.rfile:
+                    if line in (b".\r\n", b".\n"):
+                        break
+                time.sleep(self.server.delay)
+                with self.server.lock:
+                    self.server.accepted += 1
+                self._reply("250 queued")
+            elif command.startswith("QUIT"):
+                self._reply("221 bye")
+                return
+            else:
+                self._reply("250 ok")
+
+
+class _SlowSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, delay: float) -> None:
+        super().__init__(("127.0.0.1", 0), _SlowSMTPHandler)
+        self.delay = delay
+        self.accepted = 0
+        self.lock = threading.Lock()
+
+
+def _latencies(submit, submits: int, threads: int) -> list[float]:
+    def timed(index: int) -> float:
+        started = time.perf_counter()
+        submit(index)
+        return time.perf_counter() - started
+
+    with ThreadPoolExecutor(threads) as pool:
+        return list(pool.map(timed, range(submits)))
+
+
+def _report(label: str, latencies: list[float]) -> None:
+    ordered = sorted(latencies)
+    p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+    print(f"{label:<22} p50 {statistics.median(ordered) * 1000:9.2f}ms   p99 {p99 * 1000:9.2f}ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--submits", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--delay", type=float, default=0.2, help="seconds the relay takes per message")
+    args = parser.parse_args()
+
+    server = _SlowSMTPServer(args.delay)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    sender = SMTPSender("127.0.0.1", server.server_address[1], "site@example.com", "owner@example.com", starttls=False)
+
+    print(f"{args.submits} submits from {args.threads} threads, relay delay {args.delay * 1000:.0f}ms/message")
+
+    def inline(index: int) -> None:
+        sender.send([OutboxMessage(index, time.time(), "Visitor", f"v{index}@example.com", "Hello!", 0)])
+
+    _report("inline SMTP", _latencies(inline, args.submits, args.threads))
+    server.accepted = 0
+
+    with tempfile.TemporaryDirectory() as tmp:
+        outbox = Outbox(Path(tmp) / "outbox.sqlite3", sender, batch_size=50)
+
+        def queued(index: int) -> None:
+            outbox.enqueue("Visitor", f"v{index}@example.com", "Hello!")
+
+        _report("outbox enqueue", _latencies(queued, args.submits, args.threads))
+
+        started = time.perf_counter()
+        while outbox.pending():
+            time.sleep(0.05)
+        print(f"worker drained {server.accepted} messages in {time.perf_counter() - started:.1f}s")
+        outbox.stop(timeout=5)
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
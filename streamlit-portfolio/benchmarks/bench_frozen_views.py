@@ -0,0 +1,61 @@
+"""Compare deep-copied YAML trees against shared frozen views.
+
+Run from the ``streamlit-portfolio`` directory::
+
+    python benchmarks/bench_frozen_views.py --projects 10000 --calls 50
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import tempfile
+import time
+import tracemalloc
+from copy import deepcopy
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from components.data_loader import ContentStore, thaw  # noqa: E402
+from synthetic import synthetic_projects  # noqa: E402
+
+
+def _measure(label: str, func, calls: int) -> None:
+    started = time.perf_counter()
+    for _ in range(calls):
+        func()
+    elapsed = time.perf_counter() - started
+
+    # Peak allocation of a single call, measured separately so tracing does not skew timings.
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<18} {elapsed / calls * 1000:10.3f} ms/call {peak / 1024 / 1024:10.2f} MiB peak")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=10_000)
+    parser.add_argument("--calls", type=int, default=50)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        with (root / "projects.yaml").open("w", encoding="utf-8") as handle:
+            yaml.safe_dump(synthetic_projects(args.projects), handle, sort_keys=False)
+
+        store = ContentStore(root)
+        frozen = store.load("projects.yaml")
+        raw = thaw(frozen)
+
+        print(f"{args.projects} projects, {args.calls} calls")
+        _measure("deepcopy", lambda: deepcopy(raw), args.calls)
+        _measure("frozen view", lambda: store.load("projects.yaml"), args.calls)
+        _measure("thaw (mutable)", lambda: thaw(frozen), args.calls)
+
+
+if __name__ == "__main__":
+    main()
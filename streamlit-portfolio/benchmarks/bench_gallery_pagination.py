@@ -0,0 +1,66 @@
+"""Measure elements and delta bytes per gallery rerun with and without pagination.
+
+Run from the ``streamlit-portfolio`` directory::
+
+    python benchmarks/bench_gallery_pagination.py --projects 300
+"""
+from __future__ import annotations
+
+import argparse
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+from apptest_metrics import tree_stats
+
+
+_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _gallery_page(paths: list[str], projects: int, page_size: int) -> None:
+    # AppTest runs this function's source as a standalone script, so imports live inside it.
+    import sys
+
+    sys.path[:0] = paths
+
+    import streamlit as st
+
+    from components.models import parse_projects
+    from components.portfolio_gallery import render_portfolio
+    from synthetic import synthetic_projects
+
+    if "projects" not in st.session_state:
+        st.session_state["projects"] = parse_projects(synthetic_projects(projects))
+    render_portfolio(st.session_state["projects"], page_size=page_size)
+
+
+def _measure(projects: int, page_size: int) -> tuple[int, int, float]:
+    paths = [str(_ROOT / "src"), str(_ROOT / "benchmarks")]
+    at = AppTest.from_function(_gallery_page, args=(paths, projects, page_size), default_timeout=120)
+    at.run()
+    # Clear the category filter so every project matches, then time a filter rerun.
+    at.multiselect[0].set_value([])
+    started = time.perf_counter()
+    at.run()
+    elapsed = time.perf_counter() - started
+    if at.exception:
+        raise RuntimeError(at.exception)
+    elements, size = tree_stats(at)
+    return elements, size, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=300)
+    parser.add_argument("--page-size", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{args.projects} projects")
+    for label, page_size in (("all cards", args.projects), (f"page of {args.page_size}", args.page_size)):
+        elements, size, elapsed = _measure(args.projects, page_size)
+        print(f"{label:<14} {elements:8d} elements {size / 1024:10.1f} KiB {elapsed * 1000:10.1f} ms/rerun")
+
+
+if __name__ == "__main__":
+    main()
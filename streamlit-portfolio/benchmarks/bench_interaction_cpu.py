@@ -0,0 +1,121 @@
+"""Server CPU time per interaction: full-page reruns versus fragment-only reruns.
+
+``AppTest`` always reruns the whole script, so the fragment cost is measured by
+running the fragment function on its own, which is exactly what Streamlit
+executes when a widget inside the fragment changes.
+
+Run from the ``streamlit-portfolio`` directory::
+
+    python benchmarks/bench_interaction_cpu.py --repeat 20
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from streamlit.testing.v1 import AppTest
+
+
+_SRC = Path(__file__).resolve().parents[1] / "src"
+# `streamlit run` puts the script's folder on sys.path; AppTest.from_file does not.
+sys.path.insert(0, str(_SRC))
+
+
+def _gallery_fragment(src: str) -> None:
+    import sys
+
+    sys.path.insert(0, src)
+    from components.data_loader import load_projects
+    from components.portfolio_gallery import render_portfolio
+
+    render_portfolio(load_projects())
+
+
+def _contact_fragment(src: str) -> None:
+    import sys
+
+    sys.path.insert(0, src)
+    from components.contact_form import render_contact_section
+    from components.data_loader import load_profile
+
+    render_contact_section(load_profile())
+
+
+def _cpu_ms(at: AppTest, interact, repeat: int) -> float:
+    total = 0.0
+    for attempt in range(repeat):
+        interact(at, attempt)
+        started = time.process_time()
+        at.run()
+        total += time.process_time() - started
+        if at.exception:
+            raise RuntimeError(at.exception)
+    return total / repeat * 1000
+
+
+def _search(at: AppTest, attempt: int) -> None:
+    at.text_input[0].set_value("ai" if attempt % 2 else "backend")
+
+
+# Numbers every submit across both passes, so duplicate detection never rejects one.
+_SUBMITS = itertools.count()
+
+
+def _submit(at: AppTest, attempt: int) -> None:
+    at.text_input[0].input("Visitor")
+    at.text_input[1].input(f"visitor{next(_SUBMITS)}@example.com")
+    at.text_area[0].input("Hello!")
+    at.button[0].click()
+
+
+def _full_app(page: str) -> AppTest:
+    at = AppTest.from_file(str(_SRC / "app.py"), default_timeout=60)
+    at.run()
+    at.sidebar.radio[0].set_value(page).run()
+    return at
+
+
+def _run(repeat: int) -> None:
+    # Measure the accepted-submit path on every repeat instead of the rate-limit rejection.
+    from components import rate_limit
+
+    rate_limit.SESSION_LIMITER.capacity = float("inf")
+
+    scenarios = [
+        ("portfolio search", _full_app("Portfolio"), AppTest.from_function(_gallery_fragment, args=(str(_SRC),)), _search),
+        ("contact submit", _full_app("Contact"), AppTest.from_function(_contact_fragment, args=(str(_SRC),)), _submit),
+    ]
+
+    print(f"{'interaction':<18} {'full rerun':>12} {'fragment':>12}")
+    for label, full, fragment, interact in scenarios:
+        fragment.run()
+        full_ms = _cpu_ms(full, interact, repeat)
+        fragment_ms = _cpu_ms(fragment, interact, repeat)
+        print(f"{label:<18} {full_ms:10.1f}ms {fragment_ms:10.1f}ms")
+
+    # Every timed submit must have taken the accepted path, not the duplicate or rate-limit one.
+    with sqlite3.connect(os.environ["PORTFOLIO_OUTBOX_PATH"]) as db:
+        (queued,) = db.execute("SELECT COUNT(*) FROM outbox").fetchone()
+    if queued != 2 * repeat:
+        raise RuntimeError(f"expected {2 * repeat} queued submits, found {queued}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        # Keep benchmark submissions out of the real outbox.
+        os.environ["PORTFOLIO_OUTBOX_PATH"] = str(Path(tmp) / "outbox.sqlite3")
+        _run(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
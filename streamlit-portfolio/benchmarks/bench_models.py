@@ -0,0 +1,89 @@
+"""Compare raw dicts, frozen views and typed models for the project list.
+
+Reports the retained memory of each representation and the time the project
+cards spend reading fields: ``.get`` with defaults plus ``int`` coercion on the
+raw trees versus plain attribute access on the parsed models.
+
+Run from the ``streamlit-portfolio`` directory::
+
+    python benchmarks/bench_models.py --projects 10000 --passes 20
+"""
+from __future__ import annotations
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from components.data_loader import freeze  # noqa: E402
+from components.models import parse_projects  # noqa: E402
+from synthetic import synthetic_projects  # noqa: E402
+
+
+def _retained(build) -> tuple[object, float]:
+    gc.collect()
+    tracemalloc.start()
+    value = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return value, current / 1024 / 1024
+
+
+def _read_mapping(project) -> int:
+    # Mirrors what the cards did before the model layer: defaults and coercion on every render.
+    size = len(project.get("name", "Untitled Project")) + len(project.get("role", ""))
+    size += len(str(project.get("year", ""))) + len(project.get("summary", ""))
+    size += len(project.get("technologies", [])) + len(project.get("status", ""))
+    try:
+        size += min(int(project.get("maturity", 0)), 100)
+    except Exception:
+        pass
+    size += len(project.get("impact", "")) + len(project.get("highlights", []))
+    for label, url in project.get("links", {}).items():
+        size += len(label) + len(url)
+    return size
+
+
+def _read_model(project) -> int:
+    size = len(project.name) + len(project.role) + len(project.year) + len(project.summary)
+    size += len(project.technologies) + len(project.status) + project.maturity
+    size += len(project.impact) + len(project.highlights)
+    for label, url in project.links:
+        size += len(label) + len(url)
+    return size
+
+
+def _access_ms(projects, read, passes: int) -> float:
+    started = time.perf_counter()
+    for _ in range(passes):
+        for project in projects:
+            read(project)
+    return (time.perf_counter() - started) / passes * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=10_000)
+    parser.add_argument("--passes", type=int, default=20)
+    args = parser.parse_args()
+
+    raw, raw_mib = _retained(lambda: synthetic_projects(args.projects))
+    frozen, frozen_mib = _retained(lambda: freeze(synthetic_projects(args.projects)))
+    models, models_mib = _retained(lambda: parse_projects(synthetic_projects(args.projects)))
+
+    print(f"{args.projects} projects, {args.passes} field-access passes")
+    print(f"{'representation':<16} {'retained':>12} {'access':>14}")
+    for label, value, mib, read in (
+        ("raw dicts", raw, raw_mib, _read_mapping),
+        ("frozen views", frozen, frozen_mib, _read_mapping),
+        ("slotted models", models, models_mib, _read_model),
+    ):
+        print(f"{label:<16} {mib:10.2f}MiB {_access_ms(value, read, args.passes):10.2f}ms/pass")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+"""Headless render benchmarks for every page and top-level component.
+
+Drives ``src/app.py`` through ``AppTest`` (About, Portfolio with filters and
+search, Contact with a submit) and renders ``render_sidebar``,
+``render_biography_page`` and ``render_portfolio`` on their own. For each step
+it records wall time, peak traced memory, element count and serialized delta
+size. Every dataset runs in a fresh interpreter so caches and imports from one
+dataset never leak into the next.
+
+Run from the ``streamlit-portfolio`` directory::
+
+    python benchmarks/bench_render.py --scales 1 10 100
+    python benchmarks/bench_render.py --compare benchmarks/results/<old>.json
+
+Results are written to ``benchmarks/results/<git-sha>.json`` by default.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+import yaml
+
+from synthetic import generate_dataset
+
+
+_ROOT = Path(__file__).resolve().parents[1]
+_SRC = _ROOT / "src"
+_RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+# ---------------------------------------------------------------------------
+# Datasets
+# ---------------------------------------------------------------------------
+
+def scale_dataset(target: Path, factor: int) -> Path:
+    """Generate a dataset with *factor* times as many entries as the bundled data."""
+    source = _SRC / "data"
+
+    def count(name: str) -> int:
+        with (source / name).open("r", encoding="utf-8-sig") as handle:
+            return len(yaml.safe_load(handle) or [])
+
+    with (source / "profile.yaml").open("r", encoding="utf-8") as handle:
+        profile = yaml.safe_load(handle)
+    categories = profile.get("leadership", {}).get("categories", [])
+
+    return generate_dataset(
+        target,
+        projects=count("projects.yaml") * factor,
+        achievements=count("achievements.yaml") * factor,
+        testimonials=count("testimonials.yaml") * factor,
+        experience=len(profile.get("experience", [])) * factor,
+        leadership_categories=len(categories),
+        roles_per_category=max((len(category.get("items", [])) for category in categories), default=1) * factor,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Worker: runs inside a fresh interpreter with PORTFOLIO_DATA_DIR set
+# ---------------------------------------------------------------------------
+
+def _sidebar_only(src: str) -> None:
+    import sys
+
+    sys.path.insert(0, src)
+    from components.data_loader import load_achievements, load_profile
+    from components.sidebar import render_sidebar
+
+    render_sidebar(load_profile(), load_achievements())
+
+
+def _biography_only(src: str) -> None:
+    import sys
+
+    sys.path.insert(0, src)
+    from components.biography import render_biography_page
+    from components.data_loader import load_achievements, load_profile
+
+    render_biography_page(load_profile(), load_achievements())
+
+
+def _portfolio_only(src: str) -> None:
+    import sys
+
+    sys.path.insert(0, src)
+    from components.data_loader import load_projects
+    from components.portfolio_gallery import render_portfolio
+
+    render_portfolio(load_projects())
+
+
+def _measure(at, step: str, interact=None) -> dict:
+    from apptest_metrics import tree_stats
+
+    # Buttons reset after every run, so *interact* sets up each of the two runs.
+    if interact is not None:
+        interact(at, 0)
+    started = time.perf_counter()
+    at.run()
+    wall = time.perf_counter() - started
+    if at.exception:
+        raise RuntimeError(f"{step}: {at.exception}")
+
+    # Replay the same rerun under tracemalloc so tracing does not distort the timing.
+    if interact is not None:
+        interact(at, 1)
+    tracemalloc.start()
+    at.run()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    elements, delta_bytes = tree_stats(at)
+    return {"wall_ms": wall * 1000, "peak_kib": peak / 1024, "elements": elements, "delta_bytes": delta_bytes}
+
+
+def _fill_contact_form(at, attempt: int) -> None:
+    # A different address each time, so duplicate detection lets both runs through.
+    at.text_input[0].input("Benchmark Visitor")
+    at.text_input[1].input(f"visitor{attempt}@example.com")
+    at.text_area[0].input("Hello from the render benchmark!")
+    at.button[0].click()
+
+
+def run_worker() -> dict:
+    from streamlit.testing.v1 import AppTest
+
+    sys.path.insert(0, str(_SRC))
+    sys.path.insert(0, str(Path(__file__).resolve().parent))
+    results: dict[str, dict] = {}
+
+    app = AppTest.from_file(str(_SRC / "app.py"), default_timeout=600)
+    results["app:about"] = _measure(app, "about")
+    app.sidebar.radio[0].set_value("Portfolio")
+    results["app:portfolio"] = _measure(app, "portfolio")
+    app.multiselect[0].set_value([])
+    results["app:portfolio-filter"] = _measure(app, "portfolio-filter")
+    app.text_input[0].set_value("backend")
+    results["app:portfolio-search"] = _measure(app, "portfolio-search")
+    app.sidebar.radio[0].set_value("Contact")
+    results["app:contact"] = _measure(app, "contact")
+    results["app:contact-submit"] = _measure(app, "contact-submit", _fill_contact_form)
+    if not any("on its way" in message.value for message in app.success):
+        raise RuntimeError("contact-submit: the form was not accepted")
+
+    for name, script in (
+        ("render_sidebar", _sidebar_only),
+        ("render_biography_page", _biography_only),
+        ("render_portfolio", _portfolio_only),
+    ):
+        results[f"component:{name}"] = _measure(
+            AppTest.from_function(script, args=(str(_SRC),), default_timeout=600), name
+        )
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Orchestration
+# ---------------------------------------------------------------------------
+
+def _git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=_ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def _run_dataset(data_dir: Path, outbox: Path) -> dict:
+    env = dict(os.environ, PORTFOLIO_DATA_DIR=str(data_dir), PORTFOLIO_OUTBOX_PATH=str(outbox))
+    completed = subprocess.run(
+        [sys.executable, __file__, "--worker"], env=env, capture_output=True, text=True
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(completed.stderr)
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def _print_table(report: dict, baseline: dict | None) -> None:
+    for dataset, steps in report["datasets"].items():
+        print(f"\n[{dataset}]")
+        print(f"{'step':<34} {'wall':>10} {'peak':>10} {'elements':>9} {'delta':>10}")
+        for step, stats in steps.items():
+            line = (
+                f"{step:<34} {stats['wall_ms']:8.1f}ms {stats['peak_kib']:8.0f}KiB "
+                f"{stats['elements']:9d} {stats['delta_bytes'] / 1024:8.1f}KiB"
+            )
+            previous = (baseline or {}).get("datasets", {}).get(dataset, {}).get(step)
+            if previous and previous["wall_ms"]:
+                change = (stats["wall_ms"] - previous["wall_ms"]) / previous["wall_ms"] * 100
+                line += f"  {change:+6.1f}% wall vs {baseline['revision']}"
+            print(line)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 100, 1000])
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--compare", type=Path, default=None, help="earlier results file to diff against")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(run_worker()))
+        return
+
+    import streamlit
+
+    report = {
+        "revision": _git_revision(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "python": platform.python_version(),
+        "streamlit": streamlit.__version__,
+        "datasets": {},
+    }
+    with tempfile.TemporaryDirectory() as tmp:
+        for factor in args.scales:
+            label = "bundled" if factor == 1 else f"x{factor}"
+            data_dir = _SRC / "data" if factor == 1 else scale_dataset(Path(tmp) / label, factor)
+            print(f"running {label} ...", file=sys.stderr)
+            report["datasets"][label] = _run_dataset(data_dir, Path(tmp) / f"outbox-{label}.sqlite3")
+
+    output = args.output or _RESULTS_DIR / f"{report['revision']}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+    baseline = json.loads(args.compare.read_text(encoding="utf-8")) if args.compare else None
+    _print_table(report, baseline)
+    print(f"\nWrote {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Compare cold loads from the compiled snapshot against YAML parsing.
+
+Run from the ``streamlit-portfolio`` directory::
+
+    python benchmarks/bench_snapshot.py --projects 10000 --repeat 5
+"""
+from __future__ import annotations
+
+import argparse
+import pickle
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from components import data_loader  # noqa: E402
+from components.data_loader import ContentStore, compile_snapshot  # noqa: E402
+from synthetic import synthetic_projects  # noqa: E402
+
+
+def _best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        source = root / "projects.yaml"
+        with source.open("w", encoding="utf-8") as handle:
+            yaml.safe_dump(synthetic_projects(args.projects), handle, sort_keys=False)
+        raw = source.read_bytes()
+        # Compare against the whole-document path; files this big would otherwise be streamed.
+        data_loader._STREAM_MIN_BYTES = float("inf")
+        snapshot = compile_snapshot(root)
+
+        def load_snapshot() -> None:
+            with snapshot.open("rb") as handle:
+                pickle.load(handle)
+
+        results = {
+            "yaml.SafeLoader": _best_of(lambda: yaml.load(raw, Loader=yaml.SafeLoader), args.repeat),
+        }
+        if hasattr(yaml, "CSafeLoader"):
+            results["yaml.CSafeLoader"] = _best_of(lambda: yaml.load(raw, Loader=yaml.CSafeLoader), args.repeat)
+        else:
+            print("libyaml not available; skipping CSafeLoader")
+        results["snapshot pickle"] = _best_of(load_snapshot, args.repeat)
+        # Full cold path through a fresh store: stat, hash check, snapshot hit, freeze.
+        results["ContentStore cold"] = _best_of(lambda: ContentStore(root, snapshots=True).load("projects.yaml"), args.repeat)
+
+        print(f"{args.projects} projects, {len(raw) / 1024:.0f} KiB of YAML, best of {args.repeat}")
+        for label, elapsed in results.items():
+            print(f"{label:<20} {elapsed:10.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Cold-start import time and RSS for each page, measured in fresh interpreters.
+
+Every page is rendered once in bare mode (no Streamlit server) inside a new
+``python -X importtime`` process, so lazily imported dependencies are counted
+against the first page that needs them.
+
+Run from the ``streamlit-portfolio`` directory::
+
+    python benchmarks/bench_startup.py
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+
+_SRC = Path(__file__).resolve().parents[1] / "src"
+
+_CHILD = """
+import json, logging, resource, sys, time
+started = time.perf_counter()
+logging.disable(logging.WARNING)
+import components
+from components.data_loader import load_achievements, load_profile, load_projects
+page = sys.argv[1]
+if page == "sidebar":
+    components.render_sidebar(load_profile(), load_achievements())
+elif page == "about":
+    components.render_biography_page(load_profile(), load_achievements())
+elif page == "portfolio":
+    components.render_portfolio(load_projects())
+elif page == "contact":
+    components.render_contact_section(load_profile())
+elapsed = time.perf_counter() - started
+heavy = sorted(name for name in ("plotly", "pandas", "PIL") if name in sys.modules)
+print(json.dumps({"seconds": elapsed, "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, "heavy": heavy}))
+"""
+
+PAGES = ("sidebar", "about", "portfolio", "contact")
+
+
+def _import_seconds(stderr: str) -> float:
+    # -X importtime lines: "import time: self [us] | cumulative | imported package".
+    total = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            total += int(cumulative)
+    return total / 1_000_000
+
+
+def measure(page: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _CHILD, page],
+        cwd=_SRC,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    stats = json.loads(result.stdout.strip().splitlines()[-1])
+    stats["import_seconds"] = _import_seconds(result.stderr)
+    return stats
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=3, help="runs per page; the fastest is reported")
+    args = parser.parse_args()
+
+    print(f"{'page':<10} {'total':>9} {'imports':>9} {'max RSS':>10}  heavy modules")
+    for page in PAGES:
+        best = min((measure(page) for _ in range(args.repeat)), key=lambda stats: stats["seconds"])
+        print(
+            f"{page:<10} {best['seconds'] * 1000:7.0f}ms {best['import_seconds'] * 1000:7.0f}ms "
+            f"{best['max_rss_kb'] / 1024:8.1f}MB  {', '.join(best['heavy']) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Peak memory of the full-tree YAML load versus the streaming item loader.
+
+Each measurement runs in a fresh interpreter against a synthetic
+``projects.yaml`` and reports peak RSS above the post-import baseline, so the
+numbers are not skewed by whatever an earlier run left allocated. "full" is
+the whole-document parse that ``load_projects`` used before (freeze the tree,
+then build models); "stream" is ``load_projects`` with the file over the
+streaming threshold. Both end with the same models and project index.
+
+Run from the ``streamlit-portfolio`` directory::
+
+    python benchmarks/bench_streaming_loader.py --projects 5000 20000 50000
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from synthetic import iter_projects, write_items
+
+
+_SRC = Path(__file__).resolve().parents[1] / "src"
+
+_CHILD = """
+import json, resource, sys, time
+from pathlib import Path
+from components import data_loader
+from components.project_index import index_for
+mode, root = sys.argv[1], Path(sys.argv[2])
+# Full mode forces every file through the whole-document path.
+data_loader._STREAM_MIN_BYTES = float("inf") if mode == "full" else 0
+baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+started = time.perf_counter()
+projects = data_loader.load_projects(data_loader.ContentStore(root))
+index = index_for(projects)
+elapsed = time.perf_counter() - started
+peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({"seconds": elapsed, "peak_kb": peak - baseline, "projects": len(index.projects)}))
+"""
+
+MODES = ("full", "stream")
+
+
+def measure(mode: str, root: Path) -> dict:
+    result = subprocess.run(
+        [sys.executable, "-c", _CHILD, mode, str(root)],
+        cwd=_SRC,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--projects", type=int, nargs="+", default=[5_000, 20_000])
+    args = parser.parse_args()
+
+    print(f"{'projects':>9} {'YAML':>9} {'mode':<7} {'peak RSS':>10} {'time':>9}")
+    for count in args.projects:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            write_items(root / "projects.yaml", iter_projects(count))
+            size_mb = (root / "projects.yaml").stat().st_size / 1024 / 1024
+            for mode in MODES:
+                stats = measure(mode, root)
+                print(
+                    f"{count:>9} {size_mb:7.1f}MB {mode:<7} {stats['peak_kb'] / 1024:8.1f}MB "
+                    f"{stats['seconds']:8.2f}s"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,274 @@
+"""Deterministic synthetic portfolio datasets for load and scaling tests.
+
+Generates ``profile.yaml``, ``projects.yaml``, ``achievements.yaml`` and
+``testimonials.yaml`` following the same schema as ``src/data``. Items are
+produced lazily and written one at a time, so a 100k-project file never has to
+exist in memory. The same seed always yields byte-identical files.
+
+Run from the ``streamlit-portfolio`` directory::
+
+    python benchmarks/synthetic.py /tmp/portfolio-data --projects 10000 --seed 7
+    PORTFOLIO_DATA_DIR=/tmp/portfolio-data streamlit run src/app.py
+"""
+from __future__ import annotations
+
+import argparse
+import random
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Iterable, Iterator, TextIO
+
+import yaml
+
+
+TECHNOLOGIES = (
+    "Python", "TypeScript", "JavaScript", "Docker", "Firebase", "GCP", "React", "FastAPI", "PostgreSQL",
+    "LangChain", "Flutter", "Dart", "Go", "Kubernetes", "Redis", "n8n", "Vertex AI", "AWS", "Django",
+    "Flask", "SQL", "Pandas", "NumPy", "PyTorch", "TensorFlow", "Streamlit", "Next.js", "Node.js",
+    "GraphQL", "Terraform", "Rust", "C++", "Java", "Kotlin", "Swift", "Svelte", "Tailwind", "MongoDB",
+    "Elasticsearch", "Kafka", "Airflow", "Spark", "OpenCV", "Hugging Face", "Google Maps API", "Supabase",
+)
+# Zipf-like weights: a handful of technologies dominate, with a long tail.
+_TECH_WEIGHTS = tuple(accumulate(1 / rank for rank in range(1, len(TECHNOLOGIES) + 1)))
+
+CATEGORIES = (
+    "AI / Mobile", "Tools / Backend", "Web / Frontend", "Data / Analytics", "Automation", "Community",
+    "Research", "DevOps / Cloud", "Games", "Hardware / IoT",
+)
+ACHIEVEMENT_CATEGORIES = ("Programming", "Leadership", "Certification", "Hackathon", "Research", "Community")
+STATUSES = ("Completed", "Active", "Prototype", "Archived", "Maintained")
+ROLES = ("Full-Stack Developer", "Backend & Database Developer", "Team Lead", "ML Engineer", "Frontend Developer")
+IMPACTS = ("APAC Finalist", "Campus Events", "Open Source", "1k+ users", "Internal Tool", "Hackathon Winner")
+
+_WORDS = (
+    "real-time", "coordination", "pipeline", "dashboard", "workflow", "assistant", "platform", "analytics",
+    "registration", "tracking", "disaster", "response", "community", "volunteer", "automation", "insights",
+    "mobile", "campus", "events", "relief", "mapping", "scheduling", "recommendation", "search", "chatbot",
+    "integration", "monitoring", "orchestration", "prototype", "services", "sync", "api", "inventory",
+)
+# Long tail of made-up words ("bakoti", "lemuna", ...) with Zipf-like weights, so
+# the search index sees a vocabulary that keeps growing with the dataset, as
+# real project write-ups do, instead of only the handful of words above.
+_SYLLABLES = tuple(consonant + vowel for consonant in "bdfklmnprstvz" for vowel in "aeiou")
+_TAIL_WORDS = tuple(a + b + c for a in _SYLLABLES for b in _SYLLABLES[::3] for c in _SYLLABLES[::7])
+_TAIL_WEIGHTS = tuple(accumulate(1 / rank for rank in range(1, len(_TAIL_WORDS) + 1)))
+# Share of words drawn from the long tail.
+_TAIL_SHARE = 0.3
+_VERBS = ("Built", "Designed", "Integrated", "Deployed", "Led", "Implemented", "Optimized", "Shipped", "Mentored")
+
+
+def _sentence(rng: random.Random, words: int, verb: bool = False) -> str:
+    body = " ".join(
+        rng.choices(_TAIL_WORDS, cum_weights=_TAIL_WEIGHTS)[0] if rng.random() < _TAIL_SHARE else rng.choice(_WORDS)
+        for _ in range(words)
+    )
+    if verb:
+        return f"{rng.choice(_VERBS)} {body}."
+    return body[0].upper() + body[1:] + "."
+
+
+def _technologies(rng: random.Random, count: int) -> list[str]:
+    picked: list[str] = []
+    while len(picked) < count:
+        tech = rng.choices(TECHNOLOGIES, cum_weights=_TECH_WEIGHTS)[0]
+        if tech not in picked:
+            picked.append(tech)
+    return picked
+
+
+def iter_projects(count: int, seed: int = 0, highlights: int = 6) -> Iterator[dict[str, Any]]:
+    rng = random.Random(f"projects:{seed}")
+    for index in range(count):
+        yield {
+            "name": f"{_sentence(rng, 2)[:-1].title()} {index}",
+            "role": rng.choice(ROLES),
+            "year": rng.randint(2015, 2025),
+            "category": rng.choice(CATEGORIES),
+            "summary": _sentence(rng, rng.randint(8, 20)),
+            "technologies": _technologies(rng, rng.randint(2, 8)),
+            "status": rng.choice(STATUSES),
+            "maturity": rng.randint(0, 100),
+            "impact": rng.choice(IMPACTS),
+            "highlights": [_sentence(rng, rng.randint(6, 14), verb=True) for _ in range(rng.randint(1, highlights))],
+            "links": {"github": "#", "demo": "#"},
+        }
+
+
+def iter_achievements(count: int, seed: int = 0) -> Iterator[dict[str, Any]]:
+    rng = random.Random(f"achievements:{seed}")
+    for index in range(count):
+        yield {
+            "title": f"{_sentence(rng, 3)[:-1].title()} Award {index}",
+            "year": rng.randint(2015, 2025),
+            "issuer": f"{_sentence(rng, 2)[:-1].title()} Foundation",
+            "category": rng.choice(ACHIEVEMENT_CATEGORIES),
+            "description": _sentence(rng, rng.randint(6, 16)),
+        }
+
+
+def iter_testimonials(count: int, seed: int = 0) -> Iterator[dict[str, Any]]:
+    rng = random.Random(f"testimonials:{seed}")
+    for index in range(count):
+        yield {
+            "name": f"Collaborator {index}",
+            "role": rng.choice(ROLES),
+            "content": " ".join(_sentence(rng, rng.randint(8, 18)) for _ in range(rng.randint(1, 4))),
+            "year": rng.randint(2015, 2025),
+        }
+
+
+def iter_experience(count: int, seed: int = 0, highlights: int = 8) -> Iterator[dict[str, Any]]:
+    rng = random.Random(f"experience:{seed}")
+    for index in range(count):
+        start = rng.randint(2010, 2024)
+        yield {
+            "company": f"{_sentence(rng, 2)[:-1].title()} Labs {index}",
+            "title": rng.choice(ROLES),
+            "start": f"Jan {start}",
+            "end": "Present" if index == 0 else f"Dec {min(start + rng.randint(0, 3), 2025)}",
+            "summary": _sentence(rng, rng.randint(10, 24)),
+            "stack": _technologies(rng, rng.randint(2, 6)),
+            "highlights": [_sentence(rng, rng.randint(6, 14), verb=True) for _ in range(rng.randint(1, highlights))],
+        }
+
+
+def build_profile(seed: int = 0, leadership_categories: int = 3, roles_per_category: int = 5) -> dict[str, Any]:
+    """Return every profile field except ``experience``, which is streamed separately."""
+    rng = random.Random(f"profile:{seed}")
+    return {
+        "name": "Synthetic Portfolio Owner",
+        "tagline": "Generated profile for load testing",
+        "sidebar_summary": _sentence(rng, 12),
+        "location": "Cebu City, Philippines",
+        "email": "owner@example.com",
+        "phone": "+63 900 000 0000",
+        "availability": "Open for benchmarks",
+        "quick_stats": [
+            {"label": "Projects", "value": "10k+", "hint": "generated", "icon": "🛠"},
+            {"label": "Leadership", "value": "Synthetic", "hint": "2015–Present", "icon": "👥"},
+        ],
+        "summary_points": [_sentence(rng, 8) for _ in range(4)],
+        "focus_areas": ["AI", "Backend", "Automation", "Data"],
+        "hero_quote": _sentence(rng, 14),
+        "leadership": {
+            "categories": [
+                {
+                    "name": f"Category {category}",
+                    "items": [
+                        {
+                            "role": f"{rng.choice(ROLES)} {role}",
+                            "organization": f"{_sentence(rng, 2)[:-1].title()} Org",
+                            "duration": f"{rng.randint(2015, 2024)}–Present",
+                            "scope": _sentence(rng, 10),
+                            "highlights": [_sentence(rng, 8, verb=True) for _ in range(rng.randint(1, 5))],
+                        }
+                        for role in range(roles_per_category)
+                    ],
+                }
+                for category in range(leadership_categories)
+            ]
+        },
+        "skills": {
+            "radar": [{"label": tech, "score": rng.randint(40, 100)} for tech in TECHNOLOGIES[:6]],
+            "categories": [
+                {"name": "Languages", "items": list(TECHNOLOGIES[:4])},
+                {"name": "Tools", "items": list(TECHNOLOGIES[4:10])},
+            ],
+        },
+        "toolkit": ["Pandas", "NumPy", "Plotly"],
+        "soft_skills": ["Team leadership", "Communication"],
+        "education": [{"institution": "Synthetic University", "duration": "2015–2019", "program": "BS Computer Science"}],
+        "certifications": [],
+        "social_links": [{"label": "GitHub", "url": "https://github.com", "icon": "💻"}],
+        "resume": {"file": "resume.pdf", "note": "Generated"},
+        "call_to_action": "Generated data — not a real person.",
+    }
+
+
+def _dump(value: Any, handle: TextIO) -> None:
+    yaml.safe_dump(value, handle, sort_keys=False, allow_unicode=True, width=1000)
+
+
+def write_items(path: Path, items: Iterable[dict[str, Any]]) -> int:
+    """Stream *items* to *path* as a top-level YAML list, one item at a time."""
+    written = 0
+    with path.open("w", encoding="utf-8") as handle:
+        for item in items:
+            _dump([item], handle)
+            written += 1
+        if not written:
+            handle.write("[]\n")
+    return written
+
+
+def write_profile(path: Path, experience: Iterable[dict[str, Any]], seed: int = 0, **profile_options: int) -> None:
+    with path.open("w", encoding="utf-8") as handle:
+        _dump(build_profile(seed, **profile_options), handle)
+        handle.write("experience:\n")
+        wrote_any = False
+        for item in experience:
+            # A block sequence may sit at the same indentation as its parent key.
+            _dump([item], handle)
+            wrote_any = True
+        if not wrote_any:
+            handle.write("  []\n")
+
+
+def generate_dataset(
+    target: Path,
+    *,
+    projects: int = 10_000,
+    achievements: int = 1_000,
+    testimonials: int = 500,
+    experience: int = 50,
+    leadership_categories: int = 3,
+    roles_per_category: int = 5,
+    seed: int = 0,
+) -> Path:
+    """Write a complete data directory to *target* and return it."""
+    target = Path(target)
+    target.mkdir(parents=True, exist_ok=True)
+    write_profile(
+        target / "profile.yaml",
+        iter_experience(experience, seed),
+        seed,
+        leadership_categories=leadership_categories,
+        roles_per_category=roles_per_category,
+    )
+    write_items(target / "projects.yaml", iter_projects(projects, seed))
+    write_items(target / "achievements.yaml", iter_achievements(achievements, seed))
+    write_items(target / "testimonials.yaml", iter_testimonials(testimonials, seed))
+    return target
+
+
+def synthetic_projects(count: int, seed: int = 0) -> list[dict[str, Any]]:
+    return list(iter_projects(count, seed))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("target", type=Path)
+    parser.add_argument("--projects", type=int, default=10_000)
+    parser.add_argument("--achievements", type=int, default=1_000)
+    parser.add_argument("--testimonials", type=int, default=500)
+    parser.add_argument("--experience", type=int, default=50)
+    parser.add_argument("--leadership-categories", type=int, default=3)
+    parser.add_argument("--roles-per-category", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    generate_dataset(
+        args.target,
+        projects=args.projects,
+        achievements=args.achievements,
+        testimonials=args.testimonials,
+        experience=args.experience,
+        leadership_categories=args.leadership_categories,
+        roles_per_category=args.roles_per_category,
+        seed=args.seed,
+    )
+    print(f"Wrote dataset to {args.target}")
+
+
+if __name__ == "__main__":
+    main()
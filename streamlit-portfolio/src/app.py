@@ -1,53 +1,106 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Mapping
 
-import yaml
 import streamlit as st
+import streamlit.components.v1 as st_components
 
-from components import render_biography_page, render_portfolio, render_contact_section, render_sidebar
+import components
+from components import metrics
+from components.data_loader import load_achievements, load_profile, load_projects, load_testimonials
+from components.outbox import resume_delivery
+from components.tenants import resolve_tenant
+from styles.theme import load_stylesheet
 
 
 ROOT = Path(__file__).resolve().parent
 
 
-def _load_yaml(path: Path):
-     if not path.exists():
-          return {}
-     with path.open("r", encoding="utf-8") as fh:
-          return yaml.safe_load(fh) or {}
+def _inject_css(theme_path: Path):
+     stylesheet = load_stylesheet(theme_path)
+     if stylesheet is None:
+          return
 
+     # The injected <style> lives in the page <head>, so each session only needs it
+     # once, plus again whenever theme.css changes on disk.
+     if st.session_state.get("theme_fingerprint") == stylesheet.fingerprint:
+          return
+     st_components.html(stylesheet.injection_script, height=0)
+     st.session_state["theme_fingerprint"] = stylesheet.fingerprint
 
-def _inject_css():
-     css_path = ROOT / "styles" / "theme.css"
-     if css_path.exists():
-          with css_path.open("r", encoding="utf-8") as fh:
-               st.markdown(f"<style>{fh.read()}</style>", unsafe_allow_html=True)
+
+def warm_up() -> None:
+     """Load everything the first session would otherwise pay for, in this process.
+
+     Parses the data files into the shared models, builds the project index
+     and the achievement analytics, minifies the stylesheet and imports every
+     page module together with its heavy dependencies. Call it before the
+     server starts, or in a parent process before forking workers; it starts
+     no threads of its own, so it is fork-safe.
+     """
+     from components.analytics import achievement_stats, recent_testimonials
+     from components.biography import _radar_points, _skill_radar_figure
+     from components.project_index import index_for
+
+     load_stylesheet()
+     profile = load_profile()
+     achievement_stats(load_achievements())
+     recent_testimonials(load_testimonials())
+     index_for(load_projects())
+
+     for name in ("render_biography_page", "render_contact_section", "render_portfolio", "render_sidebar"):
+          getattr(components, name)
+
+     points = _radar_points(profile.skills.radar)
+     if points:
+          try:
+               _skill_radar_figure(points)
+          except ImportError:
+               pass
 
 
 def main() -> None:
-     st.set_page_config(page_title="Jared — Portfolio", layout="wide")
+     # Messages an earlier process queued are sent without waiting for the next submit.
+     resume_delivery()
+
+     # Streamlit serves every script at the site root, so the tenant comes from `?tenant=`.
+     tenant = resolve_tenant(st.query_params.get("tenant"))
+     if tenant is None:
+          st.set_page_config(page_title="Portfolio not found", layout="wide")
+          st.error("This portfolio does not exist.")
+          return
+
+     with metrics.timed("load_profile"):
+          profile = load_profile(tenant.store)
+
+     st.set_page_config(page_title=f"{profile.name.split(' ')[0] or 'My'} — Portfolio", layout="wide")
+
+     _inject_css(tenant.theme_path)
 
-     _inject_css()
+     if metrics.ENABLED and components.debug_page_requested():
+          components.render_debug_page()
+          return
 
-     data_dir = ROOT / "data"
-     profile = _load_yaml(data_dir / "profile.yaml") or {}
-     achievements = _load_yaml(data_dir / "achievements.yaml") or []
-     projects = _load_yaml(data_dir / "projects.yaml") or []
+     with metrics.timed("load_achievements"):
+          achievements = load_achievements(tenant.store)
+     with metrics.timed("load_projects"):
+          projects = load_projects(tenant.store)
 
      # Navigation at the top of sidebar
      page = st.sidebar.radio("Navigate", ["About", "Portfolio", "Contact"])
      
      # Sidebar content below navigation
-     render_sidebar(profile, achievements)
+     components.render_sidebar(profile, achievements, tenant)
 
+     # Page modules load on first use, so each page only pays for its own imports.
      if page == "About":
-          render_biography_page(profile, achievements)
+          with metrics.timed("load_testimonials"):
+               testimonials = load_testimonials(tenant.store)
+          components.render_biography_page(profile, achievements, testimonials)
      elif page == "Portfolio":
-          render_portfolio(projects)
+          components.render_portfolio(projects, tenant=tenant)
      elif page == "Contact":
-          render_contact_section(profile)
+          components.render_contact_section(profile)
 
 
 if __name__ == "__main__":
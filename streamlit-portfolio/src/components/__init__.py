@@ -1,23 +1,55 @@
-"""Convenience exports for the portfolio Streamlit components."""
-
-from .biography import (
-     render_biography_page,
-     render_hero_section,
-     render_leadership_and_service,
-     render_professional_journey,
-     render_skill_showcase,
-)
-from .contact_form import render_contact_section
-from .portfolio_gallery import render_portfolio
-from .sidebar import render_sidebar
-
-__all__ = [
-     "render_biography_page",
-     "render_contact_section",
-     "render_hero_section",
-     "render_leadership_and_service",
-     "render_portfolio",
-     "render_professional_journey",
-     "render_sidebar",
-     "render_skill_showcase",
-]
\ No newline at end of file
+"""Convenience exports for the portfolio Streamlit components.
+
+Page modules are imported on first access to one of their exports, so a worker
+serving only the Contact page never loads the About page's dependencies.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+     from .biography import (
+          render_achievement_timeline,
+          render_biography_page,
+          render_hero_section,
+          render_leadership_and_service,
+          render_professional_journey,
+          render_skill_showcase,
+          render_testimonials,
+     )
+     from .contact_form import render_contact_section
+     from .debug_page import debug_page_requested, render_debug_page
+     from .portfolio_gallery import render_portfolio
+     from .sidebar import render_sidebar
+
+# Exported name -> submodule that defines it.
+_EXPORTS = {
+     "render_achievement_timeline": "biography",
+     "render_biography_page": "biography",
+     "debug_page_requested": "debug_page",
+     "render_contact_section": "contact_form",
+     "render_debug_page": "debug_page",
+     "render_hero_section": "biography",
+     "render_leadership_and_service": "biography",
+     "render_portfolio": "portfolio_gallery",
+     "render_professional_journey": "biography",
+     "render_sidebar": "sidebar",
+     "render_skill_showcase": "biography",
+     "render_testimonials": "biography",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+     module_name = _EXPORTS.get(name)
+     if module_name is None:
+          raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+     value = getattr(import_module(f".{module_name}", __name__), name)
+     globals()[name] = value
+     return value
+
+
+def __dir__() -> list[str]:
+     return sorted(set(globals()) | set(_EXPORTS))
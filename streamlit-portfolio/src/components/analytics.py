@@ -0,0 +1,141 @@
+"""Achievement and testimonial analytics, computed once per data version.
+
+The content store hands every session the same model tuples until a file
+changes, so results are cached on the tuple's identity (as in
+``project_index.index_for``) and shared by all sessions. Newest-first ordering
+is plain Python, so the sidebar and testimonials never import pandas; the
+rollups and timeline turn the records into pandas columns once, and a rerun
+only reads the finished tuples and frame.
+"""
+from __future__ import annotations
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Sequence, TypeVar
+
+from . import metrics
+from .data_loader import register_derived_cache
+from .models import Achievement, Testimonial
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+T = TypeVar("T")
+
+# The last four-digit year in values such as "2024", "2023–2025" or "Mar 2025".
+_YEAR = r"(\d{4})(?!.*\d{4})"
+_YEAR_PATTERN = re.compile(_YEAR)
+
+
+@dataclass(frozen=True)
+class AchievementStats:
+    # Newest first; entries without a year go last and ties keep file order.
+    recent: tuple[Achievement, ...]
+    # (year, count), oldest first.
+    by_year: tuple[tuple[int, int], ...]
+    # (category, count), most common first; entries without one count as "Other".
+    by_category: tuple[tuple[str, int], ...]
+    # "Category · count" chip labels in the same order as ``by_category``.
+    category_labels: tuple[str, ...]
+    # Achievement counts with one row per year (as text, for a categorical axis) and one column per category.
+    timeline: pd.DataFrame
+
+
+def _years(values: Sequence[str]) -> pd.Series:
+    import pandas as pd
+
+    return pd.to_numeric(pd.Series(values, dtype=object).str.extract(_YEAR, expand=False), errors="coerce")
+
+
+def _year(value: str) -> int | None:
+    match = _YEAR_PATTERN.search(str(value))
+    return int(match.group(1)) if match else None
+
+
+def _newest_first(records: Sequence[T], years: Sequence[int | None]) -> tuple[T, ...]:
+    # sorted() is stable, so ties keep file order; records without a year go last.
+    order = sorted(range(len(records)), key=lambda position: (years[position] is None, -(years[position] or 0)))
+    return tuple(records[position] for position in order)
+
+
+def _achievement_stats(achievements: Sequence[Achievement]) -> AchievementStats:
+    import pandas as pd
+
+    years = _years([item.year for item in achievements])
+    categories = pd.Series([item.category for item in achievements], dtype=object).replace("", "Other")
+
+    dated = years.notna()
+    year_counts = years[dated].astype(int).value_counts().sort_index()
+    category_counts = categories.value_counts()
+    timeline = pd.crosstab(years[dated].astype(int).astype(str), categories[dated])
+    timeline.index.name = "Year"
+    timeline.columns.name = None
+
+    by_category = tuple(zip(category_counts.index.tolist(), category_counts.tolist()))
+    return AchievementStats(
+        recent=recent_achievements(achievements),
+        by_year=tuple(zip(year_counts.index.tolist(), year_counts.tolist())),
+        by_category=by_category,
+        category_labels=tuple(f"{category} · {count}" for category, count in by_category),
+        timeline=timeline,
+    )
+
+
+def _recent(records: Sequence[T]) -> tuple[T, ...]:
+    return _newest_first(records, [_year(item.year) for item in records])
+
+
+_CACHE: OrderedDict[tuple[str, int], tuple[Sequence[Any], Any]] = OrderedDict()
+# A few entries per tenant; see ``components.tenants``.
+_CACHE_SIZE = 128
+_LOCK = threading.Lock()
+
+
+def _cached(kind: str, records: Sequence[Any], build: Callable[[Sequence[Any]], T]) -> T:
+    key = (kind, id(records))
+    with _LOCK:
+        cached = _CACHE.get(key)
+        hit = cached is not None and cached[0] is records
+        if metrics.ENABLED:
+            metrics.count_cache("analytics", hit)
+        if hit:
+            _CACHE.move_to_end(key)
+            return cached[1]
+
+    value = build(records)
+    with _LOCK:
+        _CACHE[key] = (records, value)
+        _CACHE.move_to_end(key)
+        while len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return value
+
+
+def _forget(records: Any) -> None:
+    with _LOCK:
+        for kind in ("achievements", "recent", "testimonials"):
+            cached = _CACHE.get((kind, id(records)))
+            if cached is not None and cached[0] is records:
+                del _CACHE[(kind, id(records))]
+
+
+# Results for a tenant's records go when its content store drops them.
+register_derived_cache(_forget)
+
+
+def recent_achievements(achievements: Sequence[Achievement]) -> tuple[Achievement, ...]:
+    """Return *achievements* newest first, sorted once per dataset version without pandas."""
+    return _cached("recent", achievements, _recent)
+
+
+def achievement_stats(achievements: Sequence[Achievement]) -> AchievementStats:
+    """Return the ordering, rollups and timeline for *achievements*, built once per dataset version."""
+    return _cached("achievements", achievements, _achievement_stats)
+
+
+def recent_testimonials(testimonials: Sequence[Testimonial]) -> tuple[Testimonial, ...]:
+    """Return *testimonials* newest first, sorted once per dataset version."""
+    return _cached("testimonials", testimonials, _recent)
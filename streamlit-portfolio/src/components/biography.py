@@ -1,29 +1,41 @@
 from __future__ import annotations
 
-from typing import Iterable, Mapping, Sequence
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterable, Sequence
 
-import plotly.graph_objects as go
 import streamlit as st
 
+from . import metrics
+from .analytics import AchievementStats, achievement_stats, recent_testimonials
+from .html_fragments import chip_row
+from .models import Achievement, Experience, Leadership, Profile, RadarEntry, Skills, Testimonial
+from .svg_charts import RadarPoints, radar_svg
+
+if TYPE_CHECKING:
+     import plotly.graph_objects as go
+
 
 def _render_focus_badges(focus_areas: Sequence[str]) -> None:
      if not focus_areas:
           return
 
-     chips = "".join(f"<span class='focus-chip'>{area}</span>" for area in focus_areas)
-     st.markdown(f"<div class='focus-chip-row'>{chips}</div>", unsafe_allow_html=True)
+     st.markdown(chip_row(tuple(focus_areas), "focus-chip", "focus-chip-row"), unsafe_allow_html=True)
 
 
-def _plot_skill_radar(entries: Sequence[Mapping[str, float]]) -> go.Figure | None:
-     if not entries:
-          return None
+def _radar_points(entries: Sequence[RadarEntry]) -> RadarPoints:
+     points = tuple((entry.label, entry.score) for entry in entries)
+     if not any(score for _, score in points):
+          return ()
+     return points
 
-     categories = [entry.get("label", "") for entry in entries]
-     scores = [entry.get("score", 0) for entry in entries]
 
-     if not any(scores):
-          return None
+@lru_cache(maxsize=32)
+def _skill_radar_figure(points: RadarPoints) -> go.Figure:
+     # Shared by every session; st.plotly_chart copies the figure before serializing it.
+     import plotly.graph_objects as go
 
+     categories = [label for label, _ in points]
+     scores = [score for _, score in points]
      categories.append(categories[0])
      scores.append(scores[0])
 
@@ -40,147 +52,185 @@ def _plot_skill_radar(entries: Sequence[Mapping[str, float]]) -> go.Figure | Non
      return fig
 
 
-def render_hero_section(profile: Mapping[str, object]) -> None:
-     st.markdown("### Hi, I'm Jared 👋")
+metrics.register_lru_cache("skill_radar_figure", _skill_radar_figure)
+
+
+def _render_skill_radar(entries: Sequence[RadarEntry], interactive: bool) -> bool:
+     points = _radar_points(entries)
+     if not points:
+          return False
+
+     if interactive:
+          try:
+               st.plotly_chart(_skill_radar_figure(points), use_container_width=True)
+               return True
+          except ImportError:
+               pass
+
+     svg = radar_svg(points)
+     if not svg:
+          return False
+     st.markdown(svg, unsafe_allow_html=True)
+     return True
+
+
+@metrics.instrumented("render_hero_section")
+def render_hero_section(profile: Profile) -> None:
+     first_name = profile.name.split(" ")[0] or "there"
+     st.markdown(f"### Hi, I'm {first_name} 👋")
 
      cols = st.columns([2.2, 1.2])
      with cols[0]:
-          st.subheader(profile.get("tagline", ""))
-          summary_points = profile.get("summary_points", [])
-          for point in summary_points:
+          st.subheader(profile.tagline)
+          for point in profile.summary_points:
                st.write(f"- {point}")
 
-          _render_focus_badges(profile.get("focus_areas", []))
+          _render_focus_badges(profile.focus_areas)
 
      with cols[1]:
           st.markdown("#### Snapshot")
-          stats = profile.get("quick_stats", [])
-          for stat in stats[:3]:
-               label = stat.get("label", "")
-               value = stat.get("value", "")
-               hint = stat.get("hint", "")
-               st.metric(label=label, value=value, delta=hint if hint else None)
+          for stat in profile.quick_stats[:3]:
+               st.metric(label=stat.label, value=stat.value, delta=stat.hint or None)
 
-     st.markdown(profile.get("hero_quote", ""))
+     st.markdown(profile.hero_quote)
 
 
-def render_professional_journey(experiences: Iterable[Mapping[str, object]]) -> None:
+@metrics.instrumented("render_professional_journey")
+def render_professional_journey(experiences: Iterable[Experience]) -> None:
      st.divider()
      st.markdown("### Professional Journey")
      for exp in experiences:
           with st.container():
                cols = st.columns([1, 3])
                with cols[0]:
-                    st.caption(f"{exp.get('start', '')} – {exp.get('end', 'Present')}")
-                    st.markdown(f"**{exp.get('company', '')}**")
-                    stack = exp.get("stack", [])
-                    if stack:
-                         st.markdown(
-                              "<div class='stack-chip-row'>"
-                              + "".join(f"<span class='stack-chip'>{tool}</span>" for tool in stack)
-                              + "</div>",
-                              unsafe_allow_html=True,
-                         )
+                    st.caption(f"{exp.start} – {exp.end}")
+                    st.markdown(f"**{exp.company}**")
+                    if exp.stack:
+                         st.markdown(chip_row(exp.stack), unsafe_allow_html=True)
                with cols[1]:
-                    st.subheader(exp.get("title", ""), anchor=False)
-                    st.write(exp.get("summary", ""))
-                    highlights = exp.get("highlights", [])
-                    if highlights:
-                         for highlight in highlights:
-                              st.markdown(f"- {highlight}")
+                    st.subheader(exp.title, anchor=False)
+                    st.write(exp.summary)
+                    for highlight in exp.highlights:
+                         st.markdown(f"- {highlight}")
 
 
-def render_leadership_and_service(leadership: Mapping[str, Sequence[Mapping[str, object]]]) -> None:
+@metrics.instrumented("render_leadership_and_service")
+def render_leadership_and_service(leadership: Leadership) -> None:
      st.divider()
      st.markdown("### Leadership & Service")
 
-     categories = leadership.get("categories", [])
+     categories = leadership.categories
      if not categories:
           st.info("Leadership stories coming soon.")
           return
 
-     tabs = st.tabs([category.get("name", "") for category in categories])
+     tabs = st.tabs([category.name for category in categories])
      for tab, category in zip(tabs, categories):
           with tab:
-               for role in category.get("items", []):
-                    st.markdown(f"#### {role.get('role', '')}")
-                    st.caption(f"{role.get('organization', '')} · {role.get('duration', '')}")
-                    scope = role.get("scope")
-                    if scope:
-                         st.write(scope)
-                    bullet_points = role.get("highlights", [])
-                    if bullet_points:
-                         for item in bullet_points:
-                              st.markdown(f"- {item}")
-
-
-def render_skill_showcase(skills: Mapping[str, object]) -> None:
+               for role in category.items:
+                    st.markdown(f"#### {role.role}")
+                    st.caption(f"{role.organization} · {role.duration}")
+                    if role.scope:
+                         st.write(role.scope)
+                    for item in role.highlights:
+                         st.markdown(f"- {item}")
+
+
+@metrics.instrumented("render_skill_showcase")
+def render_skill_showcase(skills: Skills, interactive: bool = True) -> None:
+     """Render skill chips and the radar chart; ``interactive=False`` draws the radar as inline SVG."""
+
      st.divider()
      st.markdown("### Skill Showcase")
 
-     radar_fig = _plot_skill_radar(skills.get("radar", []))
      cols = st.columns([1.2, 1])
 
      with cols[0]:
-          categories = skills.get("categories", [])
-          for category in categories:
-               st.markdown(f"#### {category.get('name', '')}")
-               items = category.get("items", [])
-               tags = "".join(f"<span class='stack-chip'>{item}</span>" for item in items)
-               st.markdown(f"<div class='stack-chip-row'>{tags}</div>", unsafe_allow_html=True)
+          for category in skills.categories:
+               st.markdown(f"#### {category.name}")
+               st.markdown(chip_row(category.items), unsafe_allow_html=True)
 
      with cols[1]:
-          if radar_fig:
-               st.plotly_chart(radar_fig, use_container_width=True)
-          else:
+          if not _render_skill_radar(skills.radar, interactive):
                st.info("Update the radar scores in your profile data to unlock this chart.")
 
-          toolkit = skills.get("toolkit", [])
-          if toolkit:
+          if skills.toolkit:
                st.markdown("#### Toolkit Sweet Spot")
-               for item in toolkit:
+               for item in skills.toolkit:
                     st.markdown(f"- {item}")
 
-     soft_skills = skills.get("soft_skills", [])
-     if soft_skills:
+     if skills.soft_skills:
           with st.expander("Team & Personal Strengths", expanded=False):
-               for soft in soft_skills:
+               for soft in skills.soft_skills:
                     st.markdown(f"- {soft}")
 
 
-def render_biography_page(profile: Mapping[str, object], achievements: Sequence[Mapping[str, object]]) -> None:
+@metrics.instrumented("render_achievement_timeline")
+def render_achievement_timeline(stats: AchievementStats) -> None:
+     if stats.timeline.empty:
+          return
+
+     st.markdown("#### Milestones by Year")
+     first, last = stats.by_year[0][0], stats.by_year[-1][0]
+     st.caption(f"{int(stats.timeline.to_numpy().sum())} dated achievements, {first}–{last}")
+     st.bar_chart(stats.timeline, height=260)
+     st.markdown(chip_row(stats.category_labels, "focus-chip", "focus-chip-row"), unsafe_allow_html=True)
+
+
+@metrics.instrumented("render_testimonials")
+def render_testimonials(testimonials: Sequence[Testimonial], limit: int = 6) -> None:
+     if not testimonials:
+          return
+
+     st.divider()
+     st.markdown("### What People Say")
+     recent = recent_testimonials(testimonials)[:limit]
+     cols = st.columns(3)
+     for col, item in zip(cols * ((len(recent) // 3) + 1), recent):
+          with col:
+               st.markdown(f"> {item.content}")
+               st.caption(" · ".join(part for part in (f"— {item.name}", item.role, item.year) if part))
+
+
+@metrics.instrumented("render_biography_page")
+def render_biography_page(
+     profile: Profile,
+     achievements: Sequence[Achievement],
+     testimonials: Sequence[Testimonial] = (),
+) -> None:
      """Compose the default "About" page for the portfolio."""
 
      render_hero_section(profile)
 
      if achievements:
+          stats = achievement_stats(achievements)
           st.divider()
           st.markdown("### Spotlight Achievements")
           cols = st.columns(3)
-          for col, achievement in zip(cols * ((len(achievements) // 3) + 1), achievements[:6]):
+          for col, achievement in zip(cols * 2, stats.recent[:6]):
                with col:
-                    st.markdown(f"**{achievement.get('year', '')}**")
-                    st.caption(achievement.get("issuer", ""))
-                    st.write(achievement.get("title", ""))
+                    st.markdown(f"**{achievement.year}**")
+                    st.caption(achievement.issuer)
+                    st.write(achievement.title)
+          render_achievement_timeline(stats)
 
-     render_professional_journey(profile.get("experience", []))
-     render_leadership_and_service(profile.get("leadership", {}))
-     render_skill_showcase(profile.get("skills", {}))
+     render_professional_journey(profile.experience)
+     render_leadership_and_service(profile.leadership)
+     render_skill_showcase(profile.skills)
 
-     education = profile.get("education", [])
-     if education:
+     if profile.education:
           st.divider()
           st.markdown("### Education")
-          for entry in education:
-               st.markdown(f"**{entry.get('institution', '')}** · {entry.get('duration', '')}")
-               st.caption(entry.get("program", ""))
+          for entry in profile.education:
+               st.markdown(f"**{entry.institution}** · {entry.duration}")
+               st.caption(entry.program)
 
-     certifications = profile.get("certifications", [])
-     if certifications:
+     if profile.certifications:
           st.markdown("### Certifications & Trainings")
-          for cert in certifications:
+          for cert in profile.certifications:
                st.markdown(f"- {cert}")
 
-     call_to_action = profile.get("call_to_action")
-     if call_to_action:
-          st.success(call_to_action)
\ No newline at end of file
+     render_testimonials(testimonials)
+
+     if profile.call_to_action:
+          st.success(profile.call_to_action)
\ No newline at end of file
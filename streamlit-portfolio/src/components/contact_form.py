@@ -1,14 +1,60 @@
 from __future__ import annotations
 
-from typing import Mapping
+import os
+import sqlite3
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
+from . import metrics
+from .models import Profile
+from .outbox import contact_outbox
+from .rate_limit import CLIENT_LIMITER, RECENT_SUBMISSIONS, SESSION_LIMITER
 
-def render_contact_section(profile: Mapping[str, object] | None = None) -> None:
-     """Render a simple contact form. This does not send emails but shows a success state.
 
-     The function is intentionally local-only to avoid requiring external services.
+# Hidden from people by theme.css (.st-key-contact_website); form-filling bots tend to fill it in.
+_HONEYPOT_KEY = "contact_website"
+
+
+# Reverse proxies in front of the app that append to X-Forwarded-For. Clients can
+# send any X-Forwarded-For they like, so only the hops added by these proxies are
+# trusted; with none configured there is no per-client limit, only per session.
+_TRUSTED_PROXIES = int(os.environ.get("PORTFOLIO_TRUSTED_PROXIES") or 0)
+
+
+def _client_address() -> str | None:
+     """The client address as seen by the outermost trusted proxy, or None."""
+     if _TRUSTED_PROXIES <= 0:
+          return None
+     try:
+          headers = st.context.headers
+     except Exception:  # no request context, e.g. in bare mode or tests
+          return None
+     # Each proxy appends the address it received the request from, so the client
+     # is the entry added by the outermost one, counted from the right.
+     hops = [hop.strip() for value in headers.get_all("X-Forwarded-For") for hop in value.split(",")]
+     hops = [hop for hop in hops if hop]
+     if len(hops) < _TRUSTED_PROXIES:
+          return None
+     return hops[-_TRUSTED_PROXIES]
+
+
+def _rate_limited() -> bool:
+     ctx = get_script_run_ctx()
+     if ctx is not None and not SESSION_LIMITER.allow(ctx.session_id):
+          return True
+     client = _client_address()
+     return client is not None and not CLIENT_LIMITER.allow(client)
+
+
+@st.fragment
+@metrics.instrumented("render_contact_section")
+def render_contact_section(profile: Profile | None = None) -> None:
+     """Render the contact form and queue submissions in the local outbox.
+
+     Submitting only writes to the outbox; delivery happens on a background thread,
+     so the form never waits on the network. It runs as a fragment, so submitting
+     the form reruns only this section.
      """
 
      st.markdown("### Get in touch")
@@ -17,9 +63,15 @@ def render_contact_section(profile: Mapping[str, object] | None = None) -> None:
           name = st.text_input("Your name")
           email = st.text_input("Your email")
           message = st.text_area("Message")
+          honeypot = st.text_input("Leave this field empty", key=_HONEYPOT_KEY, label_visibility="collapsed")
           send = st.form_submit_button("Send message")
 
      if send:
+          # Cheap checks first, so rejected submits cost no further work.
+          if honeypot:
+               st.success("Thanks — your message is on its way.")
+               return
+
           if not name or not email or not message:
                st.error("Please fill all fields before sending.")
                return
@@ -29,9 +81,24 @@ def render_contact_section(profile: Mapping[str, object] | None = None) -> None:
                st.error("Please provide a valid email address.")
                return
 
-          # In a production app you'd call an API or send via SMTP here.
-          st.success("Thanks — your message was recorded locally.")
-          st.info("(This demo app does not forward messages. Connect an email API to enable delivery.)")
+          if not RECENT_SUBMISSIONS.add(email, message):
+               st.info("We already received this message — thanks!")
+               return
+
+          # Only submits that would be queued spend rate-limit tokens; typos and double clicks do not.
+          if _rate_limited():
+               RECENT_SUBMISSIONS.discard(email, message)
+               st.warning("You've sent several messages in a short time — please wait a minute and try again.")
+               return
+
+          try:
+               contact_outbox().enqueue(name, email, message)
+          except sqlite3.Error:
+               RECENT_SUBMISSIONS.discard(email, message)
+               st.error("Sorry — your message could not be saved. Please try again or reach out by email.")
+               return
+
+          st.success("Thanks — your message is on its way.")
 
           # Optionally echo back submission (helpful when testing locally)
           st.markdown("---")
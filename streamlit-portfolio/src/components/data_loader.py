@@ -1,32 +1,581 @@
 """Utility helpers for loading structured data used across the Streamlit app."""
 from __future__ import annotations
 
-from copy import deepcopy
-from functools import lru_cache
+import argparse
+import hashlib
+import os
+import pickle
+import sys
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable, Iterator, Mapping, TypeVar
 
 import yaml
+from yaml.composer import Composer
 
+from . import metrics
+from .models import (
+    Achievement,
+    Profile,
+    Project,
+    Testimonial,
+    iter_achievements,
+    iter_projects,
+    iter_testimonials,
+    parse_achievements,
+    parse_profile,
+    parse_projects,
+    parse_testimonials,
+)
+from .project_index import ProjectIndex, forget_index, remember_index
 
-_DATA_DIR = Path(__file__).resolve().parents[1] / "data"
 
+T = TypeVar("T")
 
-@lru_cache(maxsize=None)
-def _load_yaml_cached(relative_path: str) -> Any:
-    target = _DATA_DIR / relative_path
-    if not target.exists():
-        raise FileNotFoundError(f"Data file not found: {target}")
 
-    with target.open("r", encoding="utf-8") as handle:
-        return yaml.safe_load(handle) or {}
+# PORTFOLIO_DATA_DIR points the app at another data directory, e.g. a benchmark dataset.
+_DATA_DIR = Path(os.environ.get("PORTFOLIO_DATA_DIR") or Path(__file__).resolve().parents[1] / "data")
+_SNAPSHOT_NAME = ".snapshot.pickle"
 
+# Budget for the cached content of every non-default data directory (tenant) together.
+_CACHE_BUDGET = int(float(os.environ.get("PORTFOLIO_CACHE_MB") or 256) * 1024 * 1024)
+# Bytes of memory per byte of cached YAML: the frozen tree, the models and what
+# is derived from them (project index, analytics) measure 4-6x on synthetic data;
+# the rest is headroom for small files, whose fixed costs weigh more.
+_PARSED_OVERHEAD = 12
 
-def load_yaml(relative_path: str) -> Any:
-    """Return a deep-copied object loaded from the YAML file at *relative_path*."""
-    return deepcopy(_load_yaml_cached(relative_path))
+# Called with every value a store drops from ``_Entry.derived``, so caches keyed
+# on those values (``project_index``, ``analytics``) release them at the same time.
+_DERIVED_CACHES: list[Callable[[Any], None]] = []
+
+# Use libyaml's C parser when PyYAML was built against it.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# List files at least this large are parsed one item at a time (see ``ContentStore.load_items``).
+_STREAM_MIN_BYTES = int(float(os.environ.get("PORTFOLIO_STREAM_MB") or 1) * 1024 * 1024)
+
+# Top-level shape each known data file must have.
+_EXPECTED_TYPES: dict[str, type] = {
+    "profile.yaml": dict,
+    "projects.yaml": list,
+    "achievements.yaml": list,
+    "testimonials.yaml": list,
+}
+
+# Typed model parsers, also used by ``validate`` to check every record.
+_PARSERS: dict[str, Callable[[Any], Any]] = {
+    "profile.yaml": parse_profile,
+    "projects.yaml": parse_projects,
+    "achievements.yaml": parse_achievements,
+    "testimonials.yaml": parse_testimonials,
+}
+
+
+class FrozenMapping(Mapping[str, Any]):
+    """Read-only mapping view over a dict that is never handed out for mutation."""
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"FrozenMapping({self._data!r})"
+
+
+def freeze(value: Any) -> Any:
+    """Return *value* with every dict wrapped in a FrozenMapping and every list turned into a tuple."""
+    if isinstance(value, dict):
+        return FrozenMapping({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """Return a mutable copy of a frozen tree, built from plain dicts and lists."""
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [thaw(item) for item in value]
+    return value
+
+
+class _ItemLoader(_YAML_LOADER, Composer):
+    """The configured loader plus PyYAML's composer, so single nodes can be composed from its event stream."""
+
+    def __init__(self, stream: Any) -> None:
+        super().__init__(stream)
+        self.anchors = {}
+
+
+def iter_yaml_items(path: Path) -> Iterator[Any]:
+    """Yield the items of the top-level list in the YAML file at *path*, one at a time.
+
+    The file is read in chunks and each item is composed and constructed on its
+    own, so only one item's node graph and value exist at any moment and memory
+    stays flat however long the list is. An empty file yields nothing.
+    """
+    with path.open("rb") as handle:
+        loader = _ItemLoader(handle)
+        try:
+            loader.get_event()  # StreamStart
+            if loader.check_event(yaml.StreamEndEvent):
+                return
+            loader.get_event()  # DocumentStart
+            if not loader.check_event(yaml.SequenceStartEvent):
+                if loader.construct_document(loader.compose_node(None, None)) is None:
+                    return
+                raise ValueError(f"{path.name}: expected a top-level list")
+            loader.get_event()
+            while not loader.check_event(yaml.SequenceEndEvent):
+                yield loader.construct_document(loader.compose_node(None, None))
+        finally:
+            loader.dispose()
+
+
+@dataclass
+class _Entry:
+    mtime_ns: int
+    size: int
+    # None when the file was streamed and only its derived values are kept.
+    value: Any
+    # Values built from ``value`` by ``ContentStore.load_as``, keyed by builder.
+    derived: dict[Callable[[Any], Any], Any] = field(default_factory=dict)
+
+
+class ContentStore:
+    """Process-wide cache of parsed YAML files rooted at a data directory.
+
+    Each file is parsed once and re-parsed only when its mtime or size changes,
+    so every session can share the same parsed tree between reruns. The tree is
+    frozen (see :func:`freeze`) so callers cannot mutate the shared copy.
+
+    With ``snapshots=True``, when a compiled snapshot (see
+    :func:`compile_snapshot`) sits next to the data files, entries whose source
+    hash still matches are read from it instead of being parsed from YAML.
+    Each snapshot entry is let go once it has been served, and the unserved
+    rest counts towards :meth:`footprint`. Snapshots are pickles, so only
+    enable this for directories the deployment itself controls, never for
+    tenant folders.
+    """
+
+    def __init__(self, root: Path, snapshots: bool = False) -> None:
+        self._root = Path(root)
+        self._snapshots = snapshots
+        self._entries: dict[str, _Entry] = {}
+        self._lock = threading.Lock()
+        # Snapshot entries not served yet, and the footprint charged for them.
+        self._snapshot: dict[str, tuple[str, Any]] = {}
+        self._snapshot_mtime_ns: int | None = None
+        self._snapshot_bytes = 0
+        self._footprint = 0
+        # Called with the change in footprint whenever an entry is added or dropped.
+        self.on_resize: Callable[[int], None] | None = None
+
+    def _put(self, relative_path: str, entry: _Entry) -> None:
+        # Callers hold self._lock.
+        self._drop(relative_path)
+        self._entries[relative_path] = entry
+        self._resize(entry.size * _PARSED_OVERHEAD)
+
+    def _drop(self, relative_path: str) -> None:
+        # Callers hold self._lock.
+        entry = self._entries.pop(relative_path, None)
+        if entry is None:
+            return
+        for value in entry.derived.values():
+            for forget in _DERIVED_CACHES:
+                forget(value)
+        self._resize(-entry.size * _PARSED_OVERHEAD)
+
+    def _resize(self, delta: int) -> None:
+        self._footprint += delta
+        on_resize = self.on_resize
+        if on_resize is not None:
+            on_resize(delta)
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def load(self, relative_path: str) -> Any:
+        """Return the parsed contents of *relative_path*, re-reading it only if it changed."""
+        target = self._root / relative_path
+        try:
+            stat = target.stat()
+        except FileNotFoundError:
+            with self._lock:
+                self._drop(relative_path)
+            raise FileNotFoundError(f"Data file not found: {target}") from None
+
+        entry = self._entries.get(relative_path)
+        hit = _current(entry, stat) and entry.value is not None
+        if metrics.ENABLED:
+            metrics.count_cache("content_store", hit)
+        if hit:
+            return entry.value
+
+        with self._lock:
+            # Another session may have refreshed the entry while we waited.
+            entry = self._entries.get(relative_path)
+            if _current(entry, stat) and entry.value is not None:
+                return entry.value
+
+            value = freeze(self._parse(relative_path, target.read_bytes()))
+            if _current(entry, stat):
+                entry.value = value
+            else:
+                self._put(relative_path, _Entry(stat.st_mtime_ns, stat.st_size, value))
+            return value
+
+    def load_items(self, relative_path: str, build: Callable[[Iterable[Any]], T]) -> T:
+        """Return ``build(items)`` for the top-level list in *relative_path*, computed once per version.
+
+        Files smaller than ``PORTFOLIO_STREAM_MB`` (default 1) go through
+        :meth:`load_as`. Larger ones are streamed with :func:`iter_yaml_items`
+        straight into *build* and only its result is cached, so neither the
+        whole tree nor PyYAML's node graph is ever held in memory. Compiled
+        snapshots are not used for them: unpickling would build the tree too.
+        """
+        target = self._root / relative_path
+        try:
+            stat = target.stat()
+        except FileNotFoundError:
+            with self._lock:
+                self._drop(relative_path)
+            raise FileNotFoundError(f"Data file not found: {target}") from None
+        if stat.st_size < _STREAM_MIN_BYTES:
+            return self.load_as(relative_path, build)
+
+        entry = self._entries.get(relative_path)
+        hit = _current(entry, stat) and build in entry.derived
+        if metrics.ENABLED:
+            metrics.count_cache("content_store", hit)
+        if hit:
+            return entry.derived[build]
+
+        with self._lock:
+            entry = self._entries.get(relative_path)
+            if not _current(entry, stat):
+                entry = _Entry(stat.st_mtime_ns, stat.st_size, None)
+                self._put(relative_path, entry)
+            elif build in entry.derived:
+                return entry.derived[build]
+
+            result = entry.derived[build] = build(entry.value if entry.value is not None else iter_yaml_items(target))
+            return result
+
+    def _parse(self, relative_path: str, raw: bytes) -> Any:
+        # Callers hold self._lock.
+        cached = self._take_snapshot_entry(relative_path) if self._snapshots else None
+        if cached is not None and cached[0] == _digest(raw):
+            return cached[1]
+        return yaml.load(raw, Loader=_YAML_LOADER) or {}
+
+    def _take_snapshot_entry(self, relative_path: str) -> tuple[str, Any] | None:
+        """Remove and return the snapshot entry for *relative_path*, loading a new snapshot first."""
+        snapshot_path = self._root / _SNAPSHOT_NAME
+        try:
+            stat = snapshot_path.stat()
+        except FileNotFoundError:
+            stat = None
+
+        mtime_ns = stat.st_mtime_ns if stat is not None else None
+        if mtime_ns != self._snapshot_mtime_ns:
+            snapshot: dict[str, tuple[str, Any]] = {}
+            if stat is not None:
+                try:
+                    with snapshot_path.open("rb") as handle:
+                        snapshot = pickle.load(handle)
+                except (OSError, pickle.UnpicklingError, EOFError):
+                    snapshot = {}
+            self._snapshot, self._snapshot_mtime_ns = snapshot, mtime_ns
+            self._resize(-self._snapshot_bytes)
+            self._snapshot_bytes = stat.st_size * _PARSED_OVERHEAD if snapshot else 0
+            self._resize(self._snapshot_bytes)
+
+        # Whether or not the hash still matches, the entry is never needed again.
+        entry = self._snapshot.pop(relative_path, None)
+        if not self._snapshot and self._snapshot_bytes:
+            self._resize(-self._snapshot_bytes)
+            self._snapshot_bytes = 0
+        return entry
+
+    def footprint(self) -> int:
+        """Approximate memory held by this store's entries and everything derived from them, in bytes."""
+        return self._footprint
+
+    def load_as(self, relative_path: str, build: Callable[[Any], T]) -> T:
+        """Return ``build(tree)`` for *relative_path*, computed once per version of the file."""
+        value = self.load(relative_path)
+        entry = self._entries.get(relative_path)
+        if entry is not None and entry.value is value and build in entry.derived:
+            return entry.derived[build]
+
+        with self._lock:
+            # Re-check under the lock: another session may have built it, or
+            # the entry may have been dropped, whose derived values are forgotten.
+            entry = self._entries.get(relative_path)
+            if entry is not None and entry.value is value:
+                if build not in entry.derived:
+                    entry.derived[build] = build(value)
+                return entry.derived[build]
+
+        # The file was reloaded in between; build from what we were given.
+        return build(value)
+
+    def invalidate(self, relative_path: str | None = None) -> None:
+        """Drop the cached entry for *relative_path*, or every entry when omitted."""
+        with self._lock:
+            for path in list(self._entries) if relative_path is None else [relative_path]:
+                self._drop(path)
+
+
+def _current(entry: _Entry | None, stat: os.stat_result) -> bool:
+    return entry is not None and entry.mtime_ns == stat.st_mtime_ns and entry.size == stat.st_size
+
+
+_STORE = ContentStore(_DATA_DIR, snapshots=True)
+_DEFAULT_ROOT = _DATA_DIR.resolve()
+
+
+# Stores for other data directories, least recently used first, the footprint
+# counted for each, and the total of those.
+_STORES: OrderedDict[Path, ContentStore] = OrderedDict()
+_STORE_BYTES: dict[Path, int] = {}
+_STORES_BYTES = 0
+_STORES_LOCK = threading.Lock()
+
+
+def register_derived_cache(forget: Callable[[Any], None]) -> None:
+    """Have *forget* called with each derived value (e.g. a model tuple) a store drops."""
+    _DERIVED_CACHES.append(forget)
+
+
+register_derived_cache(forget_index)
+
+
+def _tracker(store: ContentStore) -> Callable[[int], None]:
+    def track(delta: int) -> None:
+        global _STORES_BYTES
+        with _STORES_LOCK:
+            # Growth of a store that was already evicted no longer counts.
+            if _STORES.get(store.root) is store:
+                _STORE_BYTES[store.root] += delta
+                _STORES_BYTES += delta
+
+    return track
+
+
+def content_store() -> ContentStore:
+    """Return the content store shared by every session in this process."""
+    return _STORE
+
+
+def store_for(root: Path | None = None) -> ContentStore:
+    """Return the shared store for the data directory *root*; the default store when omitted.
+
+    Stores for other directories (one per tenant) live in an LRU bounded by
+    ``PORTFOLIO_CACHE_MB``. The footprint counts each store's models and the
+    indexes and analytics derived from them. When the total exceeds the budget,
+    the least recently used stores are dropped together with those derived
+    values and simply re-read on their next visit.
+    """
+    global _STORES_BYTES
+    if root is None:
+        return _STORE
+    root = Path(root).resolve()
+    if root == _DEFAULT_ROOT:
+        return _STORE
+
+    evicted: list[ContentStore] = []
+    with _STORES_LOCK:
+        store = _STORES.get(root)
+        if store is None:
+            store = _STORES[root] = ContentStore(root)
+            _STORE_BYTES[root] = 0
+            store.on_resize = _tracker(store)
+        _STORES.move_to_end(root)
+
+        while _STORES_BYTES > _CACHE_BUDGET and len(_STORES) > 1:
+            dropped_root, dropped = _STORES.popitem(last=False)
+            dropped.on_resize = None
+            _STORES_BYTES -= _STORE_BYTES.pop(dropped_root)
+            evicted.append(dropped)
+
+    # Outside _STORES_LOCK: invalidate() takes the store's own lock.
+    for dropped in evicted:
+        dropped.invalidate()
+    return store
+
+
+def load_yaml(relative_path: str, *, mutable: bool = False) -> Any:
+    """Return the YAML file at *relative_path* as a shared, read-only tree.
+
+    Pass ``mutable=True`` to get a private copy built from plain dicts and lists
+    for callers that need to edit the data in place.
+    """
+    value = _STORE.load(relative_path)
+    return thaw(value) if mutable else value
+
+
+def _load_model(store: ContentStore | None, relative_path: str, parse: Callable[[Any], T]) -> T:
+    store = store or _STORE
+    try:
+        return store.load_as(relative_path, parse)
+    except FileNotFoundError:
+        return parse({})
+
+
+def _load_items(store: ContentStore | None, relative_path: str, build: Callable[[Iterable[Any]], T]) -> T:
+    store = store or _STORE
+    try:
+        return store.load_items(relative_path, build)
+    except FileNotFoundError:
+        return build(())
+
+
+def _build_projects(items: Iterable[Any]) -> tuple[Project, ...]:
+    # Models, facets and the search index are all built in one pass over the items.
+    index = ProjectIndex(iter_projects(items))
+    remember_index(index.projects, index)
+    return index.projects
+
+
+def _build_achievements(items: Iterable[Any]) -> tuple[Achievement, ...]:
+    return tuple(iter_achievements(items))
+
+
+def _build_testimonials(items: Iterable[Any]) -> tuple[Testimonial, ...]:
+    return tuple(iter_testimonials(items))
+
+
+def load_profile(store: ContentStore | None = None) -> Profile:
+    """Return the validated profile; an empty ``Profile`` when the file is missing."""
+    return _load_model(store, "profile.yaml", parse_profile)
+
+
+def load_projects(store: ContentStore | None = None) -> tuple[Project, ...]:
+    return _load_items(store, "projects.yaml", _build_projects)
+
+
+def load_achievements(store: ContentStore | None = None) -> tuple[Achievement, ...]:
+    return _load_items(store, "achievements.yaml", _build_achievements)
+
+
+def load_testimonials(store: ContentStore | None = None) -> tuple[Testimonial, ...]:
+    return _load_items(store, "testimonials.yaml", _build_testimonials)
+
+
+def invalidate(relative_path: str | None = None, root: Path | None = None) -> None:
+    """Force the store for *root* (default: the shared store) to re-read *relative_path*, or everything."""
+    if root is None:
+        _STORE.invalidate(relative_path)
+        return
+    with _STORES_LOCK:
+        store = _STORES.get(Path(root).resolve())
+    if store is not None:
+        store.invalidate(relative_path)
 
 
 def data_dir() -> Path:
     """Expose the resolved data directory for assets such as the resume file."""
-    return _DATA_DIR
+    return _STORE.root
+
+
+def _digest(raw: bytes) -> str:
+    return hashlib.sha256(raw).hexdigest()
+
+
+def validate_data(root: Path | None = None) -> dict[str, tuple[str, Any]]:
+    """Parse every YAML file under *root* and check it against the typed models.
+
+    Returns ``{relative_path: (source_sha256, parsed_value)}`` and raises
+    ``ValueError`` listing every file that failed to parse or validate.
+    """
+    root = Path(root) if root is not None else _STORE.root
+    parsed: dict[str, tuple[str, Any]] = {}
+    problems: list[str] = []
+
+    for path in sorted(root.glob("*.yaml")):
+        raw = path.read_bytes()
+        try:
+            value = yaml.load(raw, Loader=_YAML_LOADER) or {}
+        except yaml.YAMLError as exc:
+            problems.append(f"{path.name}: {exc}")
+            continue
+
+        expected = _EXPECTED_TYPES.get(path.name)
+        if expected is not None and value != {} and not isinstance(value, expected):
+            problems.append(f"{path.name}: expected a top-level {expected.__name__}, got {type(value).__name__}")
+            continue
+
+        parse = _PARSERS.get(path.name)
+        if parse is not None:
+            try:
+                parse(value)
+            except ValueError as exc:
+                problems.append(str(exc))
+                continue
+        parsed[path.name] = (_digest(raw), value)
+
+    if problems:
+        raise ValueError("Invalid data files:\n" + "\n".join(problems))
+    return parsed
+
+
+def compile_snapshot(root: Path | None = None) -> Path:
+    """Validate the data directory and write a pickled snapshot keyed by source hashes.
+
+    List files big enough to be streamed (see ``ContentStore.load_items``) are
+    left out: they are never read from the snapshot, and unpickling them would
+    build the whole tree the streaming path keeps out of memory.
+    """
+    root = Path(root) if root is not None else _STORE.root
+    entries = {
+        name: entry
+        for name, entry in validate_data(root).items()
+        if not (_EXPECTED_TYPES.get(name) is list and (root / name).stat().st_size >= _STREAM_MIN_BYTES)
+    }
+
+    target = root / _SNAPSHOT_NAME
+    staging = target.with_suffix(".tmp")
+    with staging.open("wb") as handle:
+        pickle.dump(entries, handle, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(staging, target)
+    return target
+
+
+def _main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m components.data_loader")
+    parser.add_argument("command", choices=["compile", "validate"])
+    parser.add_argument("--data-dir", type=Path, default=None, help="defaults to src/data")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "validate":
+            entries = validate_data(args.data_dir)
+            print(f"{len(entries)} data files OK")
+        else:
+            target = compile_snapshot(args.data_dir)
+            print(f"Wrote {target}")
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main())
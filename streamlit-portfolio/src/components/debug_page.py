@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import os
+
+import streamlit as st
+
+from . import metrics
+
+
+def debug_page_requested() -> bool:
+     """True when metrics are on and the URL asks for ``?debug=metrics`` with the right token."""
+     if not metrics.ENABLED or st.query_params.get("debug") != "metrics":
+          return False
+     token = os.environ.get("PORTFOLIO_METRICS_TOKEN")
+     return not token or st.query_params.get("token") == token
+
+
+def render_debug_page() -> None:
+     """Render the process-wide render metrics. Only reachable through ``debug_page_requested``."""
+
+     st.markdown("### Runtime metrics")
+     st.caption("Process-wide since start-up; every session contributes.")
+
+     data = metrics.snapshot()
+     sections = data["sections"]
+     if sections:
+          rows = []
+          for name, stats in sorted(sections.items(), key=lambda item: -item[1]["sum"]):
+               count = stats["count"] or 1
+               rows.append(
+                    {
+                         "section": name,
+                         "calls": stats["count"],
+                         "mean ms": round(stats["sum"] / count * 1000, 2),
+                         "total ms": round(stats["sum"] * 1000, 1),
+                         "elements / call": round(stats["elements"] / count, 1),
+                    }
+               )
+          st.dataframe(rows, hide_index=True, use_container_width=True)
+     else:
+          st.info("No sections recorded yet — open the other pages first.")
+
+     caches = data["caches"]
+     if caches:
+          st.markdown("#### Caches")
+          rows = []
+          for name, results in sorted(caches.items()):
+               lookups = results["hit"] + results["miss"]
+               rows.append(
+                    {
+                         "cache": name,
+                         "hits": results["hit"],
+                         "misses": results["miss"],
+                         "hit rate": f"{results['hit'] / lookups:.0%}" if lookups else "–",
+                    }
+               )
+          st.dataframe(rows, hide_index=True, use_container_width=True)
+
+     text = metrics.prometheus_text()
+     st.download_button("Download Prometheus text", text, file_name="portfolio-metrics.prom", mime="text/plain")
+     with st.expander("Prometheus text", expanded=False):
+          st.code(text, language="text")
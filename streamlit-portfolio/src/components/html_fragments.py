@@ -0,0 +1,60 @@
+"""Pre-rendered, escaped HTML snippets for the chip rows and sidebar cards.
+
+Every builder is memoized on its (hashable, immutable) input, so each snippet is
+built and escaped once per distinct content and then shared by all sessions.
+A data change produces new records, which simply miss the cache; the bounded
+LRU drops snippets for content that is no longer shown.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+from html import escape
+
+from . import metrics
+from .models import Achievement, SocialLink, Stat
+
+
+# Large enough for every project's chip row in a 10k-project gallery page set.
+_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def chip_row(items: tuple[str, ...], chip_class: str = "stack-chip", row_class: str = "stack-chip-row") -> str:
+    """Return a ``<div>`` of ``<span>`` chips, or ``""`` when there is nothing to show."""
+    if not items:
+        return ""
+    chips = "".join(f"<span class='{chip_class}'>{escape(item)}</span>" for item in items)
+    return f"<div class='{row_class}'>{chips}</div>"
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def fact_chip(fact: Stat) -> str:
+    return (
+        f"<div class='fact-chip'>{escape(fact.icon)} <strong>{escape(fact.value)}</strong>"
+        f"<span>{escape(fact.label)}</span><small>{escape(fact.hint)}</small></div>"
+    )
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def highlight_item(achievement: Achievement) -> str:
+    return (
+        f"<div class='highlight-item'><strong>{escape(achievement.year)}</strong> · "
+        f"{escape(achievement.title)}</div>"
+    )
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def social_link(link: SocialLink) -> str:
+    return f"{escape(link.icon)} <a href='{escape(link.url)}' target='_blank'>{escape(link.label)}</a>"
+
+
+_BUILDERS = (chip_row, fact_chip, highlight_item, social_link)
+
+
+def cache_info() -> dict[str, object]:
+    """Hit/miss statistics for each fragment builder, keyed by builder name."""
+    return {builder.__name__: builder.cache_info() for builder in _BUILDERS}
+
+
+for _builder in _BUILDERS:
+    metrics.register_lru_cache(f"html_fragments.{_builder.__name__}", _builder)
@@ -0,0 +1,287 @@
+"""Resized WebP/JPEG/PNG variants of the image assets, cached on disk.
+
+Every source image gets one file per width in ``WIDTHS`` (never wider than the
+source) in WebP plus a fallback in the source's own family: JPEG for photos,
+PNG for images with transparency. Variants live under
+``assets/.cache/images/<source-hash>/`` so an edited image gets fresh files and
+an unchanged one is never converted twice, whichever process asks first.
+
+Variants are built lazily on first use, or ahead of time for a whole folder
+with a process pool. Run from the ``src`` directory::
+
+    python -m components.images                 # every image under assets/
+    python -m components.images path/to/a.png --workers 4
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import os
+import shutil
+import sys
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable, Sequence
+
+
+ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
+CACHE_DIR = ASSETS_DIR / ".cache" / "images"
+
+# Sub-folder of Streamlit's ``static/`` directory that variants are published to;
+# tenant slugs cannot start with "_", so it never clashes with a tenant's folder.
+STATIC_SUBDIR = "_variants"
+
+WIDTHS = (320, 640, 1280)
+SOURCE_SUFFIXES = {".jpg", ".jpeg", ".png", ".webp", ".gif", ".bmp", ".tif", ".tiff"}
+
+_WEBP_QUALITY = 80
+_JPEG_QUALITY = 82
+
+
+@dataclass(frozen=True, slots=True)
+class Variant:
+    path: Path
+    width: int
+    format: str
+
+    @property
+    def mime(self) -> str:
+        return f"image/{self.format}"
+
+
+# Both caches are shared by every tenant; variants are keyed by content, so
+# identical images in different portfolios are converted once.
+_MEMO_SIZE = 4096
+_DIGESTS: OrderedDict[Path, tuple[int, int, str]] = OrderedDict()
+_DIGEST_LOCK = threading.Lock()
+# Source hash -> variants, so a render does not re-read the manifest.
+_VARIANTS: OrderedDict[str, tuple[Variant, ...]] = OrderedDict()
+# Source hash -> lock held while its variants are built, so sessions asking for
+# the same new image wait for one build instead of racing it.
+_BUILDING: dict[str, threading.Lock] = {}
+
+
+def _remember(cache: OrderedDict, key, value) -> None:
+    with _DIGEST_LOCK:
+        cache[key] = value
+        cache.move_to_end(key)
+        while len(cache) > _MEMO_SIZE:
+            cache.popitem(last=False)
+
+
+def source_digest(source: Path) -> str:
+    """Content hash of *source*, recomputed only when its mtime or size changes."""
+    stat = source.stat()
+    cached = _DIGESTS.get(source)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        return cached[2]
+
+    digest = hashlib.sha256(source.read_bytes()).hexdigest()[:16]
+    _remember(_DIGESTS, source, (stat.st_mtime_ns, stat.st_size, digest))
+    return digest
+
+
+def _manifest(folder: Path) -> tuple[Variant, ...] | None:
+    # The manifest is written last, so its presence means every variant is complete.
+    manifest = folder / "variants.txt"
+    if not manifest.exists():
+        return None
+    variants = []
+    for line in manifest.read_text(encoding="utf-8").splitlines():
+        name, width, image_format = line.split()
+        variants.append(Variant(folder / name, int(width), image_format))
+    return tuple(variants)
+
+
+def _staging(target: Path) -> Path:
+    # Unique per writer, so concurrent builds in other processes never share a temp file.
+    return target.with_name(f".{target.name}.{os.getpid()}.{uuid.uuid4().hex[:8]}.tmp")
+
+
+def _write_atomic(image, target: Path, image_format: str, **options) -> None:
+    staging = _staging(target)
+    image.save(staging, format=image_format, **options)
+    os.replace(staging, target)
+
+
+def _write_atomic_text(target: Path, text: str) -> None:
+    staging = _staging(target)
+    staging.write_text(text, encoding="utf-8")
+    os.replace(staging, target)
+
+
+def build_variants(source: Path, widths: Sequence[int] = WIDTHS) -> tuple[Variant, ...]:
+    """Create (or reuse) the resized variants of *source*, smallest width first."""
+    source = Path(source).resolve()
+    digest = source_digest(source)
+    cached = _VARIANTS.get(digest)
+    if cached is not None:
+        return cached
+
+    with _DIGEST_LOCK:
+        lock = _BUILDING.setdefault(digest, threading.Lock())
+    try:
+        with lock:
+            return _build_variants(source, digest, widths)
+    finally:
+        with _DIGEST_LOCK:
+            if _BUILDING.get(digest) is lock:
+                del _BUILDING[digest]
+
+
+def _build_variants(source: Path, digest: str, widths: Sequence[int]) -> tuple[Variant, ...]:
+    from PIL import Image, ImageOps
+
+    folder = CACHE_DIR / digest
+    # Also covers a build that finished while this thread waited for the lock.
+    cached = _manifest(folder)
+    if cached is not None:
+        _remember(_VARIANTS, digest, cached)
+        return cached
+
+    folder.mkdir(parents=True, exist_ok=True)
+    variants: list[Variant] = []
+    with Image.open(source) as opened:
+        image = ImageOps.exif_transpose(opened)
+        has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+        image = image.convert("RGBA" if has_alpha else "RGB")
+        fallback = "png" if has_alpha else "jpeg"
+
+        targets = sorted({width for width in widths if width < image.width} | {min(max(widths), image.width)})
+        for width in targets:
+            height = max(1, round(image.height * width / image.width))
+            resized = image if width == image.width else image.resize((width, height), Image.Resampling.LANCZOS)
+
+            webp = folder / f"{width}.webp"
+            _write_atomic(resized, webp, "WEBP", quality=_WEBP_QUALITY, method=6)
+            variants.append(Variant(webp, width, "webp"))
+
+            other = folder / f"{width}.{'png' if has_alpha else 'jpg'}"
+            if has_alpha:
+                _write_atomic(resized, other, "PNG", optimize=True)
+            else:
+                _write_atomic(resized, other, "JPEG", quality=_JPEG_QUALITY, optimize=True, progressive=True)
+            variants.append(Variant(other, width, fallback))
+
+    lines = "".join(f"{variant.path.name} {variant.width} {variant.format}\n" for variant in variants)
+    _write_atomic_text(folder / "variants.txt", lines)
+    _remember(_VARIANTS, digest, tuple(variants))
+    return tuple(variants)
+
+
+def resolve_asset(relative_path: str, assets_dir: Path = ASSETS_DIR) -> Path | None:
+    """Return the asset at *relative_path* inside *assets_dir*, or None if it is missing."""
+    if not relative_path:
+        return None
+    candidate = (assets_dir / relative_path).resolve()
+    if assets_dir.resolve() not in candidate.parents or not candidate.is_file():
+        return None
+    return candidate
+
+
+def pick_variant(
+    relative_path: str,
+    display_width: int,
+    pixel_ratio: float = 2.0,
+    formats: Sequence[str] = ("webp", "jpeg", "png"),
+    assets_dir: Path = ASSETS_DIR,
+) -> Path | None:
+    """Return the smallest variant wide enough for *display_width* CSS pixels.
+
+    Falls back to the widest variant when none is wide enough, and to None when
+    the asset is missing or cannot be decoded.
+    """
+    source = resolve_asset(relative_path, assets_dir)
+    if source is None:
+        return None
+    try:
+        variants = build_variants(source)
+    except OSError:
+        return None
+
+    for image_format in formats:
+        candidates = [variant for variant in variants if variant.format == image_format]
+        if not candidates:
+            continue
+        needed = display_width * pixel_ratio
+        for variant in candidates:
+            if variant.width >= needed:
+                return variant.path
+        return candidates[-1].path
+    return None
+
+
+def static_dir() -> Path | None:
+    """The ``static/`` folder Streamlit serves at ``app/static/``, or None when static serving is off."""
+    import streamlit as st
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is None or not st.get_option("server.enableStaticServing"):
+        return None
+    return Path(ctx.main_script_path).resolve().parent / "static"
+
+
+def publish_variant(variant: Path, folder: Path) -> str:
+    """Expose *variant* inside the static *folder* and return its path relative to that folder.
+
+    The file is hard-linked (copied where links are not possible) once, under a
+    name that includes the source hash, so browsers can cache it indefinitely.
+    """
+    name = f"{STATIC_SUBDIR}/{variant.parent.name}-{variant.name}"
+    target = folder / name
+    if not target.exists():
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = _staging(target)
+        try:
+            os.link(variant, staging)
+        except OSError:
+            shutil.copyfile(variant, staging)
+        os.replace(staging, target)
+    return name
+
+
+def iter_sources(root: Path = ASSETS_DIR) -> Iterable[Path]:
+    for path in sorted(root.rglob("*")):
+        if path.suffix.lower() in SOURCE_SUFFIXES and CACHE_DIR not in path.parents:
+            yield path
+
+
+def _build_one(source: Path) -> tuple[Path, int, str]:
+    try:
+        return source, len(build_variants(source)), ""
+    except OSError as exc:
+        return source, 0, str(exc)
+
+
+def build_all(sources: Iterable[Path], workers: int | None = None) -> list[tuple[Path, int, str]]:
+    """Build variants for *sources* in a process pool; returns ``(source, variants, error)`` rows."""
+    sources = list(sources)
+    if not sources:
+        return []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_build_one, sources, chunksize=4))
+
+
+def _main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m components.images")
+    parser.add_argument("sources", nargs="*", type=Path, help="defaults to every image under assets/")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    failed = 0
+    for source, count, error in build_all(args.sources or iter_sources(), args.workers):
+        if error:
+            failed += 1
+            print(f"{source}: {error}", file=sys.stderr)
+        else:
+            print(f"{source}: {count} variants")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main())
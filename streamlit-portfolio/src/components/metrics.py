@@ -0,0 +1,225 @@
+"""Opt-in runtime metrics: section latency histograms, element counts and cache hits.
+
+Set ``PORTFOLIO_METRICS=1`` to enable. When it is unset, ``instrumented``
+returns the wrapped function unchanged and ``timed`` returns a shared no-op
+context manager, so production reruns pay nothing.
+
+Metrics are process-wide and exposed three ways:
+
+* the hidden debug page at ``?debug=metrics`` (``components.debug_page``),
+  which also honours ``PORTFOLIO_METRICS_TOKEN`` when it is set (``&token=...``);
+* :func:`prometheus_text`, the Prometheus text exposition format;
+* a file dump every ``PORTFOLIO_METRICS_INTERVAL`` seconds (default 15) to
+  ``PORTFOLIO_METRICS_FILE``, e.g. for node_exporter's textfile collector.
+"""
+from __future__ import annotations
+
+import functools
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+ENABLED = os.environ.get("PORTFOLIO_METRICS", "").lower() in {"1", "true", "yes", "on"}
+
+# Upper bounds in seconds; the implicit last bucket is +Inf.
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class Histogram:
+    __slots__ = ("counts", "total", "count", "elements")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.elements = 0
+
+    def observe(self, seconds: float, elements: int = 0) -> None:
+        index = 0
+        while index < len(BUCKETS) and seconds > BUCKETS[index]:
+            index += 1
+        self.counts[index] += 1
+        self.total += seconds
+        self.count += 1
+        self.elements += elements
+
+
+_LOCK = threading.Lock()
+_SECTIONS: dict[str, Histogram] = {}
+_COUNTERS: dict[tuple[str, str], int] = {}
+# Cache name -> callable returning (hits, misses), read only when metrics are collected.
+_CACHE_SOURCES: dict[str, Callable[[], tuple[int, int]]] = {}
+
+
+def _element_counter() -> list[int] | None:
+    """Per-run count of elements sent to the browser, or None outside a script run."""
+    from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+    ctx = get_script_run_ctx()
+    if ctx is None:
+        return None
+    counter = getattr(ctx, "_portfolio_element_counter", None)
+    if counter is None:
+        counter = [0]
+        enqueue = ctx._enqueue
+
+        def counting_enqueue(msg) -> None:
+            if msg.WhichOneof("type") == "delta":
+                counter[0] += 1
+            enqueue(msg)
+
+        ctx._enqueue = counting_enqueue
+        ctx._portfolio_element_counter = counter
+    return counter
+
+
+def observe(section: str, seconds: float, elements: int = 0) -> None:
+    with _LOCK:
+        histogram = _SECTIONS.get(section)
+        if histogram is None:
+            histogram = _SECTIONS[section] = Histogram()
+        histogram.observe(seconds, elements)
+
+
+@contextmanager
+def _timed(section: str) -> Iterator[None]:
+    counter = _element_counter()
+    before = counter[0] if counter else 0
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        observe(section, time.perf_counter() - started, (counter[0] - before) if counter else 0)
+
+
+def timed(section: str):
+    """Context manager recording the duration and element count of *section*."""
+    return _timed(section) if ENABLED else nullcontext()
+
+
+def instrumented(section: str) -> Callable[[F], F]:
+    """Decorator form of :func:`timed`; a no-op that returns *func* itself when disabled."""
+
+    def decorate(func: F) -> F:
+        if not ENABLED:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with _timed(section):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def count_cache(cache: str, hit: bool) -> None:
+    """Count a hit or miss for a cache that is not an ``lru_cache``. Callers guard with ``ENABLED``."""
+    key = (cache, "hit" if hit else "miss")
+    with _LOCK:
+        _COUNTERS[key] = _COUNTERS.get(key, 0) + 1
+
+
+def register_lru_cache(cache: str, func: Any) -> None:
+    """Report a ``functools.lru_cache`` function's own hit/miss statistics as *cache*."""
+
+    def read() -> tuple[int, int]:
+        info = func.cache_info()
+        return info.hits, info.misses
+
+    _CACHE_SOURCES[cache] = read
+
+
+def snapshot() -> dict[str, Any]:
+    """Consistent copy of every metric, for the debug page and the exporters."""
+    with _LOCK:
+        sections = {
+            name: {
+                "buckets": list(h.counts),
+                "sum": h.total,
+                "count": h.count,
+                "elements": h.elements,
+            }
+            for name, h in _SECTIONS.items()
+        }
+        caches: dict[str, dict[str, int]] = {}
+        for (cache, result), value in _COUNTERS.items():
+            caches.setdefault(cache, {"hit": 0, "miss": 0})[result] = value
+    for cache, read in _CACHE_SOURCES.items():
+        hits, misses = read()
+        caches[cache] = {"hit": hits, "miss": misses}
+    return {"sections": sections, "caches": caches}
+
+
+def _label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def prometheus_text() -> str:
+    data = snapshot()
+    lines = [
+        "# HELP portfolio_section_seconds Render time per section.",
+        "# TYPE portfolio_section_seconds histogram",
+    ]
+    for name, stats in sorted(data["sections"].items()):
+        section = _label(name)
+        cumulative = 0
+        for bound, count in zip((*map(str, BUCKETS), "+Inf"), stats["buckets"]):
+            cumulative += count
+            lines.append(f'portfolio_section_seconds_bucket{{section="{section}",le="{bound}"}} {cumulative}')
+        lines.append(f'portfolio_section_seconds_sum{{section="{section}"}} {stats["sum"]:.6f}')
+        lines.append(f'portfolio_section_seconds_count{{section="{section}"}} {stats["count"]}')
+
+    lines += [
+        "# HELP portfolio_section_elements_total Elements sent to the browser per section.",
+        "# TYPE portfolio_section_elements_total counter",
+    ]
+    for name, stats in sorted(data["sections"].items()):
+        lines.append(f'portfolio_section_elements_total{{section="{_label(name)}"}} {stats["elements"]}')
+
+    lines += [
+        "# HELP portfolio_cache_requests_total Cache lookups by result.",
+        "# TYPE portfolio_cache_requests_total counter",
+    ]
+    for cache, results in sorted(data["caches"].items()):
+        for result in ("hit", "miss"):
+            lines.append(f'portfolio_cache_requests_total{{cache="{_label(cache)}",result="{result}"}} {results[result]}')
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus_file(path: Path) -> None:
+    staging = path.with_name(f".{path.name}.tmp")
+    staging.write_text(prometheus_text(), encoding="utf-8")
+    os.replace(staging, path)
+
+
+def _dump_forever(path: Path, interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        try:
+            write_prometheus_file(path)
+        except OSError:
+            pass
+
+
+def _start_dump_thread() -> None:
+    threading.Thread(
+        target=_dump_forever,
+        args=(Path(os.environ["PORTFOLIO_METRICS_FILE"]), float(os.environ.get("PORTFOLIO_METRICS_INTERVAL", "15"))),
+        name="metrics-dump",
+        daemon=True,
+    ).start()
+
+
+if ENABLED and os.environ.get("PORTFOLIO_METRICS_FILE"):
+    _start_dump_thread()
+    # Threads do not survive fork(); give each pre-forked worker its own dumper.
+    if hasattr(os, "register_at_fork"):
+        os.register_at_fork(after_in_child=_start_dump_thread)
@@ -0,0 +1,355 @@
+"""Typed, validated records for the portfolio data files.
+
+Each ``parse_*`` function takes the raw tree loaded from YAML, checks its
+shape and normalises every field once (defaults, string coercion, clamping), so
+the render code can use plain attribute access. Records are frozen, hashable
+``__slots__`` dataclasses, which also keeps memory per entry well below the
+equivalent dicts.
+"""
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence, TypeVar
+
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True, slots=True)
+class Stat:
+    label: str = ""
+    value: str = ""
+    hint: str = ""
+    icon: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Experience:
+    company: str = ""
+    title: str = ""
+    start: str = ""
+    end: str = "Present"
+    summary: str = ""
+    stack: tuple[str, ...] = ()
+    highlights: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class LeadershipRole:
+    role: str = ""
+    organization: str = ""
+    duration: str = ""
+    scope: str = ""
+    highlights: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class LeadershipCategory:
+    name: str = ""
+    items: tuple[LeadershipRole, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Leadership:
+    categories: tuple[LeadershipCategory, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class RadarEntry:
+    label: str = ""
+    score: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class SkillCategory:
+    name: str = ""
+    items: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Skills:
+    radar: tuple[RadarEntry, ...] = ()
+    categories: tuple[SkillCategory, ...] = ()
+    toolkit: tuple[str, ...] = ()
+    soft_skills: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True, slots=True)
+class Education:
+    institution: str = ""
+    duration: str = ""
+    program: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class SocialLink:
+    label: str = "Connect"
+    url: str = "#"
+    icon: str = "🔗"
+
+
+@dataclass(frozen=True, slots=True)
+class Resume:
+    file: str = ""
+    note: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Profile:
+    name: str = ""
+    tagline: str = ""
+    sidebar_summary: str = ""
+    location: str = ""
+    email: str = ""
+    phone: str = ""
+    availability: str = ""
+    quick_stats: tuple[Stat, ...] = ()
+    summary_points: tuple[str, ...] = ()
+    focus_areas: tuple[str, ...] = ()
+    hero_quote: str = ""
+    experience: tuple[Experience, ...] = ()
+    leadership: Leadership = Leadership()
+    skills: Skills = Skills()
+    education: tuple[Education, ...] = ()
+    certifications: tuple[str, ...] = ()
+    social_links: tuple[SocialLink, ...] = ()
+    resume: Resume = Resume()
+    call_to_action: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Project:
+    name: str = "Untitled Project"
+    role: str = ""
+    year: str = ""
+    category: str = ""
+    summary: str = ""
+    technologies: tuple[str, ...] = ()
+    status: str = ""
+    maturity: int = 0
+    impact: str = ""
+    highlights: tuple[str, ...] = ()
+    links: tuple[tuple[str, str], ...] = ()
+    # Screenshot path relative to assets/, e.g. "images/regit.png".
+    image: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Achievement:
+    title: str = ""
+    year: str = ""
+    issuer: str = ""
+    category: str = ""
+    description: str = ""
+
+
+@dataclass(frozen=True, slots=True)
+class Testimonial:
+    name: str = ""
+    role: str = ""
+    content: str = ""
+    year: str = ""
+
+
+# ---------------------------------------------------------------------------
+# Field coercion
+# ---------------------------------------------------------------------------
+
+def _mapping(raw: Any, where: str) -> Mapping[str, Any]:
+    if raw is None:
+        return {}
+    if not isinstance(raw, Mapping):
+        raise ValueError(f"{where}: expected a mapping, got {type(raw).__name__}")
+    return raw
+
+
+def _sequence(raw: Any, where: str) -> Sequence[Any]:
+    if raw is None:
+        return ()
+    if isinstance(raw, (str, bytes)) or not isinstance(raw, Sequence):
+        raise ValueError(f"{where}: expected a list, got {type(raw).__name__}")
+    return raw
+
+
+def _text(raw: Mapping[str, Any], key: str, default: str = "") -> str:
+    value = raw.get(key)
+    return default if value is None else str(value)
+
+
+def _texts(raw: Mapping[str, Any], key: str, where: str) -> tuple[str, ...]:
+    return tuple(str(item) for item in _sequence(raw.get(key), f"{where}.{key}") if item is not None)
+
+
+def _records(raw: Mapping[str, Any], key: str, where: str, build: Callable[[Mapping[str, Any], str], T]) -> tuple[T, ...]:
+    items = _sequence(raw.get(key), f"{where}.{key}")
+    return tuple(build(_mapping(item, f"{where}.{key}[{i}]"), f"{where}.{key}[{i}]") for i, item in enumerate(items))
+
+
+def _number(raw: Mapping[str, Any], key: str, default: float = 0) -> float:
+    try:
+        value = float(raw.get(key, default))
+    except (TypeError, ValueError):
+        return default
+    # YAML's .nan and .inf parse as floats but are no usable score or percentage.
+    return value if math.isfinite(value) else default
+
+
+def _stat(raw: Mapping[str, Any], where: str) -> Stat:
+    return Stat(_text(raw, "label"), _text(raw, "value"), _text(raw, "hint"), _text(raw, "icon"))
+
+
+def _experience(raw: Mapping[str, Any], where: str) -> Experience:
+    return Experience(
+        company=_text(raw, "company"),
+        title=_text(raw, "title"),
+        start=_text(raw, "start"),
+        end=_text(raw, "end", "Present"),
+        summary=_text(raw, "summary"),
+        stack=_texts(raw, "stack", where),
+        highlights=_texts(raw, "highlights", where),
+    )
+
+
+def _leadership_role(raw: Mapping[str, Any], where: str) -> LeadershipRole:
+    return LeadershipRole(
+        role=_text(raw, "role"),
+        organization=_text(raw, "organization"),
+        duration=_text(raw, "duration"),
+        scope=_text(raw, "scope"),
+        highlights=_texts(raw, "highlights", where),
+    )
+
+
+def _leadership_category(raw: Mapping[str, Any], where: str) -> LeadershipCategory:
+    return LeadershipCategory(_text(raw, "name"), _records(raw, "items", where, _leadership_role))
+
+
+def _radar_entry(raw: Mapping[str, Any], where: str) -> RadarEntry:
+    return RadarEntry(_text(raw, "label"), _number(raw, "score"))
+
+
+def _skill_category(raw: Mapping[str, Any], where: str) -> SkillCategory:
+    return SkillCategory(_text(raw, "name"), _texts(raw, "items", where))
+
+
+def _education(raw: Mapping[str, Any], where: str) -> Education:
+    return Education(_text(raw, "institution"), _text(raw, "duration"), _text(raw, "program"))
+
+
+def _social_link(raw: Mapping[str, Any], where: str) -> SocialLink:
+    return SocialLink(_text(raw, "label", "Connect"), _text(raw, "url", "#"), _text(raw, "icon", "🔗"))
+
+
+# ---------------------------------------------------------------------------
+# Public parsers
+# ---------------------------------------------------------------------------
+
+def parse_profile(raw: Any) -> Profile:
+    where = "profile.yaml"
+    raw = _mapping(raw, where)
+    leadership = _mapping(raw.get("leadership"), f"{where}.leadership")
+    skills = _mapping(raw.get("skills"), f"{where}.skills")
+    resume = _mapping(raw.get("resume"), f"{where}.resume")
+
+    return Profile(
+        name=_text(raw, "name"),
+        tagline=_text(raw, "tagline"),
+        sidebar_summary=_text(raw, "sidebar_summary"),
+        location=_text(raw, "location"),
+        email=_text(raw, "email"),
+        phone=_text(raw, "phone"),
+        availability=_text(raw, "availability"),
+        quick_stats=_records(raw, "quick_stats", where, _stat),
+        summary_points=_texts(raw, "summary_points", where),
+        focus_areas=_texts(raw, "focus_areas", where),
+        hero_quote=_text(raw, "hero_quote"),
+        experience=_records(raw, "experience", where, _experience),
+        leadership=Leadership(_records(leadership, "categories", f"{where}.leadership", _leadership_category)),
+        skills=Skills(
+            radar=_records(skills, "radar", f"{where}.skills", _radar_entry),
+            categories=_records(skills, "categories", f"{where}.skills", _skill_category),
+            toolkit=_texts(skills, "toolkit", f"{where}.skills"),
+            soft_skills=_texts(skills, "soft_skills", f"{where}.skills"),
+        ),
+        education=_records(raw, "education", where, _education),
+        certifications=_texts(raw, "certifications", where),
+        social_links=_records(raw, "social_links", where, _social_link),
+        resume=Resume(_text(resume, "file"), _text(resume, "note")),
+        call_to_action=_text(raw, "call_to_action"),
+    )
+
+
+def _project(raw: Mapping[str, Any], where: str) -> Project:
+    links = _mapping(raw.get("links"), f"{where}.links")
+    return Project(
+        name=_text(raw, "name", "Untitled Project"),
+        role=_text(raw, "role"),
+        year=_text(raw, "year"),
+        category=_text(raw, "category"),
+        summary=_text(raw, "summary"),
+        technologies=_texts(raw, "technologies", where),
+        status=_text(raw, "status"),
+        maturity=max(0, min(int(_number(raw, "maturity")), 100)),
+        impact=_text(raw, "impact"),
+        highlights=_texts(raw, "highlights", where),
+        links=tuple((str(label), str(url)) for label, url in links.items()),
+        image=_text(raw, "image"),
+    )
+
+
+def _achievement(raw: Mapping[str, Any], where: str) -> Achievement:
+    return Achievement(
+        title=_text(raw, "title"),
+        year=_text(raw, "year"),
+        issuer=_text(raw, "issuer"),
+        category=_text(raw, "category"),
+        description=_text(raw, "description"),
+    )
+
+
+def _testimonial(raw: Mapping[str, Any], where: str) -> Testimonial:
+    return Testimonial(
+        name=_text(raw, "name"),
+        role=_text(raw, "role"),
+        content=_text(raw, "content"),
+        year=_text(raw, "year"),
+    )
+
+
+def _parse_list(raw: Any, where: str, build: Callable[[Mapping[str, Any], str], T]) -> tuple[T, ...]:
+    # Empty YAML files load as {}; treat them as an empty list.
+    if not raw:
+        return ()
+    items = _sequence(raw, where)
+    return tuple(build(_mapping(item, f"{where}[{i}]"), f"{where}[{i}]") for i, item in enumerate(items))
+
+
+def _iter_list(items: Iterable[Any], where: str, build: Callable[[Mapping[str, Any], str], T]) -> Iterator[T]:
+    for i, item in enumerate(items):
+        yield build(_mapping(item, f"{where}[{i}]"), f"{where}[{i}]")
+
+
+def parse_projects(raw: Any) -> tuple[Project, ...]:
+    return _parse_list(raw, "projects.yaml", _project)
+
+
+def parse_achievements(raw: Any) -> tuple[Achievement, ...]:
+    return _parse_list(raw, "achievements.yaml", _achievement)
+
+
+def parse_testimonials(raw: Any) -> tuple[Testimonial, ...]:
+    return _parse_list(raw, "testimonials.yaml", _testimonial)
+
+
+def iter_projects(items: Iterable[Any]) -> Iterator[Project]:
+    """Build projects one at a time from a stream of raw items (see ``data_loader.iter_yaml_items``)."""
+    return _iter_list(items, "projects.yaml", _project)
+
+
+def iter_achievements(items: Iterable[Any]) -> Iterator[Achievement]:
+    return _iter_list(items, "achievements.yaml", _achievement)
+
+
+def iter_testimonials(items: Iterable[Any]) -> Iterator[Testimonial]:
+    return _iter_list(items, "testimonials.yaml", _testimonial)
@@ -0,0 +1,397 @@
+"""Durable outbox for contact-form submissions, delivered in the background.
+
+``enqueue`` appends a row to a SQLite database in WAL mode and returns at once,
+so the script thread never waits on the network. A single daemon thread per
+process claims due rows in batches, hands them to a pluggable ``Sender`` and
+retries failures with capped exponential backoff and jitter. Undelivered rows
+survive restarts and are picked up by the next worker.
+
+Delivery is configured through environment variables:
+
+``PORTFOLIO_OUTBOX_PATH``
+    SQLite file, ``streamlit-portfolio/outbox.sqlite3`` by default.
+``PORTFOLIO_SMTP_HOST`` / ``PORTFOLIO_SMTP_PORT`` / ``PORTFOLIO_SMTP_USER`` / ``PORTFOLIO_SMTP_PASSWORD``
+    SMTP relay; without a host, messages are only logged.
+``PORTFOLIO_SMTP_FROM`` / ``PORTFOLIO_CONTACT_TO``
+    Envelope sender and the address that receives the submissions.
+"""
+from __future__ import annotations
+
+import logging
+import os
+import random
+import smtplib
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from email.message import EmailMessage
+from pathlib import Path
+from typing import Iterable, Protocol, Sequence
+
+
+_LOGGER = logging.getLogger(__name__)
+
+_DEFAULT_PATH = Path(__file__).resolve().parents[2] / "outbox.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created REAL NOT NULL,
+    name TEXT NOT NULL,
+    email TEXT NOT NULL,
+    body TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt REAL,
+    delivered REAL,
+    last_error TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_due ON outbox (next_attempt) WHERE delivered IS NULL;
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class OutboxMessage:
+    id: int
+    created: float
+    name: str
+    email: str
+    body: str
+    attempts: int
+
+
+class Sender(Protocol):
+    def send(self, messages: Sequence[OutboxMessage], deadline: float | None = None) -> Iterable[int]:
+        """Deliver *messages* and return the ids that were accepted.
+
+        Work must stop by *deadline* (a ``time.monotonic()`` value) when one is
+        given; messages not sent by then are left out of the result. Raising
+        counts as a failure for the whole batch, so a sender that has already
+        delivered some messages should return their ids instead.
+        """
+
+
+class LogSender:
+    """Default sender when no relay is configured: records each message in the log."""
+
+    def send(self, messages: Sequence[OutboxMessage], deadline: float | None = None) -> Iterable[int]:
+        for message in messages:
+            _LOGGER.info("Contact message %d from %s <%s>", message.id, message.name, message.email)
+        return [message.id for message in messages]
+
+
+class _DeadlineSMTP(smtplib.SMTP):
+    """SMTP client whose network waits all end by *deadline* (a ``time.monotonic()`` value)."""
+
+    def __init__(self, host: str, port: int, timeout: float, deadline: float) -> None:
+        self.deadline = deadline
+        super().__init__(host, port, timeout=min(timeout, self._left()))
+
+    def _left(self) -> float:
+        left = self.deadline - time.monotonic()
+        if left <= 0:
+            raise TimeoutError("SMTP batch ran past its deadline")
+        return left
+
+    def _arm(self) -> None:
+        if self.sock is not None:
+            self.sock.settimeout(min(self.timeout, self._left()))
+
+    def send(self, s):
+        self._arm()
+        super().send(s)
+
+    def getreply(self):
+        self._arm()
+        return super().getreply()
+
+
+# Failures that concern one message; the connection can still carry the others.
+_MESSAGE_ERRORS = (
+    smtplib.SMTPRecipientsRefused,
+    smtplib.SMTPSenderRefused,
+    smtplib.SMTPDataError,
+    ValueError,  # header values with CR/LF
+)
+
+
+class SMTPSender:
+    """Deliver each batch over one SMTP connection."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 587,
+        sender: str = "",
+        recipient: str = "",
+        username: str | None = None,
+        password: str | None = None,
+        starttls: bool = True,
+        timeout: float = 30.0,
+    ) -> None:
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.recipient = recipient
+        self.username = username
+        self.password = password
+        self.starttls = starttls
+        self.timeout = timeout
+
+    def _email(self, message: OutboxMessage) -> EmailMessage:
+        email = EmailMessage()
+        email["From"] = self.sender
+        email["To"] = self.recipient
+        email["Reply-To"] = message.email
+        email["Subject"] = f"Portfolio contact from {message.name}"
+        email.set_content(message.body)
+        return email
+
+    def send(self, messages: Sequence[OutboxMessage], deadline: float | None = None) -> Iterable[int]:
+        delivered: list[int] = []
+        deadline = deadline if deadline is not None else float("inf")
+        client = _DeadlineSMTP(self.host, self.port, self.timeout, deadline)
+        try:
+            if self.starttls:
+                client.starttls()
+            if self.username:
+                client.login(self.username, self.password or "")
+            for message in messages:
+                try:
+                    client.send_message(self._email(message))
+                except _MESSAGE_ERRORS as exc:
+                    # smtplib has already reset the transaction, so the next message can go.
+                    _LOGGER.warning("Contact message %d refused: %s", message.id, exc)
+                    continue
+                except (smtplib.SMTPException, OSError) as exc:
+                    # The connection is gone; keep what was accepted and retry the rest later.
+                    _LOGGER.warning("Contact delivery stopped after %d message(s): %s", len(delivered), exc)
+                    break
+                delivered.append(message.id)
+        finally:
+            try:
+                client.quit()
+            except (smtplib.SMTPException, OSError):
+                client.close()
+        return delivered
+
+
+# Share of the lease a sender may spend on one batch; the rest covers recording the results.
+_LEASE_SHARE = 0.75
+
+
+class Outbox:
+    """Append-only SQLite queue plus the background thread that drains it."""
+
+    def __init__(
+        self,
+        path: Path,
+        sender: Sender | None = None,
+        *,
+        batch_size: int = 20,
+        poll_interval: float = 30.0,
+        base_delay: float = 2.0,
+        max_delay: float = 600.0,
+        max_attempts: int = 10,
+        lease: float = 120.0,
+    ) -> None:
+        self.path = Path(path)
+        self.sender = sender or LogSender()
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_attempts = max_attempts
+        self.lease = lease
+
+        self._local = threading.local()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connection() as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections are not shareable across threads, so keep one per thread.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=10.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    # -- producer side -------------------------------------------------------
+
+    def enqueue(self, name: str, email: str, body: str) -> int:
+        """Persist a submission and wake the worker; returns the message id."""
+        now = time.time()
+        cursor = self._connection().execute(
+            "INSERT INTO outbox (created, name, email, body, next_attempt) VALUES (?, ?, ?, ?, ?)",
+            (now, name, email, body, now),
+        )
+        self.start()
+        self._wake.set()
+        return int(cursor.lastrowid)
+
+    def pending(self) -> int:
+        """Number of messages not yet delivered, including ones that gave up retrying."""
+        (count,) = self._connection().execute("SELECT COUNT(*) FROM outbox WHERE delivered IS NULL").fetchone()
+        return int(count)
+
+    # -- worker side ---------------------------------------------------------
+
+    def _claim(self, now: float) -> list[OutboxMessage]:
+        conn = self._connection()
+        # Push next_attempt past the lease so another process sharing the file skips these rows.
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            rows = conn.execute(
+                "SELECT id, created, name, email, body, attempts FROM outbox "
+                "WHERE delivered IS NULL AND next_attempt <= ? ORDER BY next_attempt LIMIT ?",
+                (now, self.batch_size),
+            ).fetchall()
+            conn.executemany(
+                "UPDATE outbox SET next_attempt = ? WHERE id = ?", [(now + self.lease, row[0]) for row in rows]
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        return [OutboxMessage(*row) for row in rows]
+
+    def _backoff(self, attempts: int) -> float:
+        delay = min(self.base_delay * 2 ** (attempts - 1), self.max_delay)
+        return delay * random.uniform(0.5, 1.0)
+
+    def _record(self, batch: Sequence[OutboxMessage], delivered: set[int], error: str) -> None:
+        now = time.time()
+        conn = self._connection()
+        conn.executemany(
+            "UPDATE outbox SET delivered = ?, attempts = attempts + 1, last_error = NULL WHERE id = ?",
+            [(now, message.id) for message in batch if message.id in delivered],
+        )
+        retries = []
+        for message in batch:
+            if message.id in delivered:
+                continue
+            attempts = message.attempts + 1
+            # NULL next_attempt parks the row: it stays in the outbox but is never claimed again.
+            next_attempt = now + self._backoff(attempts) if attempts < self.max_attempts else None
+            retries.append((attempts, next_attempt, error, message.id))
+        conn.executemany("UPDATE outbox SET attempts = ?, next_attempt = ?, last_error = ? WHERE id = ?", retries)
+
+    def deliver_due(self) -> int:
+        """Send every message that is due now, batch by batch; returns how many were delivered."""
+        total = 0
+        while not self._stop.is_set():
+            batch = self._claim(time.time())
+            if not batch:
+                break
+            # Finish with the batch well before its lease runs out, so no other worker
+            # claims and resends messages that are still being delivered.
+            deadline = time.monotonic() + self.lease * _LEASE_SHARE
+            try:
+                delivered = set(self.sender.send(batch, deadline=deadline))
+                error = "rejected by sender"
+            except Exception as exc:  # any sender failure is retried later
+                _LOGGER.warning("Contact delivery failed for %d message(s): %s", len(batch), exc)
+                delivered, error = set(), f"{type(exc).__name__}: {exc}"
+            self._record(batch, delivered, error)
+            total += len(delivered)
+            if len(batch) < self.batch_size:
+                break
+        return total
+
+    def _next_due_in(self) -> float:
+        (due,) = self._connection().execute(
+            "SELECT MIN(next_attempt) FROM outbox WHERE delivered IS NULL AND next_attempt IS NOT NULL"
+        ).fetchone()
+        if due is None:
+            return self.poll_interval
+        return max(0.0, min(due - time.time(), self.poll_interval))
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.deliver_due()
+                timeout = self._next_due_in()
+            except sqlite3.Error:
+                _LOGGER.exception("Contact outbox worker error")
+                timeout = self.poll_interval
+            self._wake.wait(timeout)
+            self._wake.clear()
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="contact-outbox", daemon=True)
+                self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        self._stop.set()
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+
+def sender_from_env() -> Sender:
+    host = os.environ.get("PORTFOLIO_SMTP_HOST")
+    if not host:
+        return LogSender()
+    return SMTPSender(
+        host,
+        int(os.environ.get("PORTFOLIO_SMTP_PORT", "587")),
+        sender=os.environ.get("PORTFOLIO_SMTP_FROM", ""),
+        recipient=os.environ.get("PORTFOLIO_CONTACT_TO", ""),
+        username=os.environ.get("PORTFOLIO_SMTP_USER"),
+        password=os.environ.get("PORTFOLIO_SMTP_PASSWORD"),
+    )
+
+
+_OUTBOX: Outbox | None = None
+_OUTBOX_LOCK = threading.Lock()
+_RESUME_CHECKED = False
+
+
+def _outbox_path() -> Path:
+    return Path(os.environ.get("PORTFOLIO_OUTBOX_PATH") or _DEFAULT_PATH)
+
+
+def contact_outbox() -> Outbox:
+    """Return the process-wide outbox, creating it and its worker on first use."""
+    global _OUTBOX
+    if _OUTBOX is None:
+        with _OUTBOX_LOCK:
+            if _OUTBOX is None:
+                _OUTBOX = Outbox(_outbox_path(), sender_from_env())
+                # Deliver anything a previous process left behind.
+                _OUTBOX.start()
+    return _OUTBOX
+
+
+def resume_delivery() -> None:
+    """Start the worker if an earlier process left messages undelivered.
+
+    Called on every script run; only the first call in a process does any work,
+    and it creates nothing when there is no outbox file yet.
+    """
+    global _RESUME_CHECKED
+    if _RESUME_CHECKED:
+        return
+    _RESUME_CHECKED = True
+    if _OUTBOX is None and not _outbox_path().exists():
+        return
+    try:
+        # contact_outbox() starts the worker, which picks up every due row.
+        pending = contact_outbox().pending()
+        if pending:
+            _LOGGER.info("Resuming delivery of %d contact message(s)", pending)
+    except (sqlite3.Error, OSError):
+        _LOGGER.exception("Could not open the contact outbox")
@@ -1,37 +1,104 @@
 from __future__ import annotations
 
-from typing import Iterable, Mapping
+from html import escape
+from typing import Iterable
 
 import streamlit as st
 
-
-def _collect_unique(items: Iterable[Mapping[str, object]], key: str) -> list[str]:
-     values: set[str] = set()
-     for item in items:
-          raw = item.get(key)
-          if isinstance(raw, str):
-               values.add(raw)
-     return sorted(values)
-
-
-def _collect_tags(items: Iterable[Mapping[str, object]]) -> list[str]:
-     tags: set[str] = set()
-     for item in items:
-          for tech in item.get("technologies", []) or []:
-               tags.add(tech)
-     return sorted(tags)
-
-
-def render_portfolio(projects: Iterable[Mapping[str, object]]) -> None:
-     projects = list(projects)
+from . import metrics
+from .html_fragments import chip_row
+from .images import pick_variant, publish_variant, static_dir
+from .models import Project
+from .project_index import index_for
+from .tenants import DEFAULT_TENANT, Tenant
+
+
+# Number of project cards built per page; "Load more" reveals the next page.
+PAGE_SIZE = 10
+
+# Rendered width of a card screenshot in the status column, in CSS pixels.
+CARD_IMAGE_WIDTH = 320
+
+_VISIBLE_KEY = "portfolio_visible"
+_FILTERS_KEY = "portfolio_filters"
+
+
+def _show_more(step: int) -> None:
+     st.session_state[_VISIBLE_KEY] += step
+
+
+def _render_card_image(project: Project, tenant: Tenant) -> None:
+     """Show the smallest pre-resized variant that is still sharp on high-DPI screens."""
+     folder = static_dir()
+     if folder is not None:
+          variant = pick_variant(project.image, CARD_IMAGE_WIDTH, assets_dir=tenant.assets_dir)
+          if variant is not None:
+               # The browser fetches the WebP itself; no bytes go through the session.
+               src = f"app/static/{publish_variant(variant, folder)}"
+               st.markdown(
+                    f"<img class='project-shot' src='{escape(src)}' alt='{escape(project.name)}' loading='lazy'>",
+                    unsafe_allow_html=True,
+               )
+               return
+
+     # st.image re-encodes anything that is not already JPEG/PNG in the requested
+     # format, so send the matching fallback variant, which it passes through unchanged.
+     variant = pick_variant(project.image, CARD_IMAGE_WIDTH, formats=("jpeg", "png"), assets_dir=tenant.assets_dir)
+     if variant is not None:
+          output_format = "PNG" if variant.suffix == ".png" else "JPEG"
+          st.image(str(variant), use_column_width=True, output_format=output_format)
+
+
+def _render_project_card(project: Project, tenant: Tenant) -> None:
+     with st.container():
+          title_col, status_col = st.columns([3, 1])
+          with title_col:
+               st.markdown(f"### {project.name}")
+               if project.role or project.year:
+                    st.caption(f"{project.role} · {project.year}")
+               st.write(project.summary)
+
+               if project.technologies:
+                    st.markdown(chip_row(project.technologies), unsafe_allow_html=True)
+
+          with status_col:
+               if project.image:
+                    _render_card_image(project, tenant)
+               if project.status:
+                    st.success(project.status)
+               if project.maturity:
+                    st.progress(project.maturity)
+               if project.impact:
+                    st.caption(project.impact)
+
+          if project.highlights:
+               with st.expander("What made this special", expanded=False):
+                    for highlight in project.highlights:
+                         st.markdown(f"- {highlight}")
+
+          if project.links:
+               st.markdown(" • ".join(f"[{label.title()}]({url})" for label, url in project.links))
+
+
+@st.fragment
+@metrics.instrumented("render_portfolio")
+def render_portfolio(projects: Iterable[Project], page_size: int = PAGE_SIZE, tenant: Tenant = DEFAULT_TENANT) -> None:
+     """Render the filterable project gallery, building cards only for the visible pages.
+
+     Runs as a fragment: filter, search and "Load more" interactions rerun only the gallery.
+     """
+
+     if not isinstance(projects, tuple):
+          projects = tuple(projects)
      st.markdown("### Featured Projects")
 
      if not projects:
           st.info("Projects will appear here once you add them to `src/data/projects.yaml`.")
           return
 
-     categories = _collect_unique(projects, "category")
-     tags = _collect_tags(projects)
+     index = index_for(projects)
+     categories = index.categories
+     tags = index.technologies
 
      filters_col, search_col = st.columns([2, 1])
      with filters_col:
@@ -41,66 +108,27 @@ def render_portfolio(projects: Iterable[Mapping[str, object]]) -> None:
      with search_col:
           search_term = st.text_input("Search", placeholder="Try 'LangChain' or 'relief'")
 
-     def matches_filters(project: Mapping[str, object]) -> bool:
-          if selected_categories and project.get("category") not in selected_categories:
-               return False
-          if selected_tags:
-               project_tags = set(project.get("technologies", []))
-               if not project_tags.issuperset(selected_tags):
-                    return False
-          if search_term:
-               haystack = " ".join(
-                    [str(project.get("name", "")), project.get("summary", ""), " ".join(project.get("highlights", []))]
-               ).lower()
-               if search_term.lower() not in haystack:
-                    return False
-          return True
-
-     filtered = [project for project in projects if matches_filters(project)]
+     filtered = index.filter(selected_categories, selected_tags, search_term)
      if not filtered:
           st.warning("No projects match the current filters—try broadening your selection.")
           return
 
-     # Render each project as a card-like container
-     for project in filtered:
-          with st.container():
-               title_col, status_col = st.columns([3, 1])
-               with title_col:
-                    st.markdown(f"### {project.get('name', 'Untitled Project')}")
-                    role = project.get('role', '')
-                    year = project.get('year', '')
-                    if role or year:
-                         st.caption(f"{role} · {year}")
-                    st.write(project.get("summary", ""))
-
-                    tech_tags = "".join(f"<span class='stack-chip'>{tech}</span>" for tech in project.get("technologies", []))
-                    if tech_tags:
-                         st.markdown(f"<div class='stack-chip-row'>{tech_tags}</div>", unsafe_allow_html=True)
-
-               with status_col:
-                    status = project.get("status", "")
-                    if status:
-                         st.success(status)
-                    progress = project.get("maturity", 0)
-                    try:
-                         progress_val = int(progress)
-                    except Exception:
-                         progress_val = 0
-                    if progress_val:
-                         st.progress(min(progress_val, 100))
-                    impact = project.get("impact", "")
-                    if impact:
-                         st.caption(impact)
-
-               highlights = project.get("highlights", [])
-               if highlights:
-                    with st.expander("What made this special", expanded=False):
-                         for highlight in highlights:
-                              st.markdown(f"- {highlight}")
-
-               links = project.get("links", {})
-               if links:
-                    link_fragments = []
-                    for label, url in links.items():
-                         link_fragments.append(f"[{label.title()}]({url})")
-                    st.markdown(" • ".join(link_fragments))
\ No newline at end of file
+     # Start again from the first page whenever the filters change.
+     filters = (tuple(selected_categories), tuple(selected_tags), search_term)
+     if st.session_state.get(_FILTERS_KEY) != filters or _VISIBLE_KEY not in st.session_state:
+          st.session_state[_FILTERS_KEY] = filters
+          st.session_state[_VISIBLE_KEY] = page_size
+
+     visible = filtered[: st.session_state[_VISIBLE_KEY]]
+     for project in visible:
+          _render_project_card(project, tenant)
+
+     remaining = len(filtered) - len(visible)
+     if remaining > 0:
+          st.caption(f"Showing {len(visible)} of {len(filtered)} projects")
+          st.button(
+               f"Load {min(page_size, remaining)} more",
+               on_click=_show_more,
+               args=(page_size,),
+               key="portfolio_load_more",
+          )
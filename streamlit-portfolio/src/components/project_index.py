@@ -0,0 +1,156 @@
+"""Prebuilt search and facet index over the portfolio projects."""
+from __future__ import annotations
+
+import threading
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import chain
+from typing import Any, Iterable, Sequence
+
+from . import metrics
+from .models import Project
+
+
+def _iter_bits(mask: int) -> Iterable[int]:
+    # Walking the binary string is linear in the bitset size, unlike repeated mask arithmetic.
+    bits = bin(mask)[:1:-1]
+    position = bits.find("1")
+    while position != -1:
+        yield position
+        position = bits.find("1", position + 1)
+
+
+def _mask(positions: Iterable[int], size: int) -> int:
+    """Bitset with the given *positions* set, built in one pass instead of one big-int ``|`` per position."""
+    bits = bytearray((size + 7) // 8)
+    for position in positions:
+        bits[position >> 3] |= 1 << (position & 7)
+    return int.from_bytes(bits, "little")
+
+
+class ProjectIndex:
+    """Inverted token index plus category/technology bitsets for a project list.
+
+    Each project is identified by its position in the list. Token postings are
+    sorted position arrays, so the index grows with the text, not with
+    vocabulary x projects. Category and technology postings, a few dozen in
+    all, are integer bitsets built once at the end, so filters become a handful
+    of ``|``/``&`` operations instead of a scan over every project.
+
+    *projects* is consumed in a single pass, so it can be a generator fed
+    straight from the YAML stream.
+    """
+
+    def __init__(self, projects: Iterable[Project]) -> None:
+        collected: list[Project] = []
+        self._haystacks: list[str] = []
+        self._tokens: dict[str, array[int]] = {}
+        by_category: dict[str, list[int]] = {}
+        by_technology: dict[str, list[int]] = {}
+
+        for position, project in enumerate(projects):
+            collected.append(project)
+            haystack = " ".join([project.name, project.summary, " ".join(project.highlights)]).lower()
+            self._haystacks.append(haystack)
+            for token in set(haystack.split()):
+                postings = self._tokens.get(token)
+                if postings is None:
+                    postings = self._tokens[token] = array("I")
+                postings.append(position)
+
+            if project.category:
+                by_category.setdefault(project.category, []).append(position)
+            for tech in project.technologies:
+                by_technology.setdefault(tech, []).append(position)
+
+        self.projects = tuple(collected)
+        size = len(self.projects)
+        self._all = (1 << size) - 1
+        self._by_category = {category: _mask(positions, size) for category, positions in by_category.items()}
+        self._by_technology = {tech: _mask(positions, size) for tech, positions in by_technology.items()}
+        self.categories = sorted(self._by_category)
+        self.technologies = sorted(self._by_technology)
+        self._token_mask = lru_cache(maxsize=256)(self._token_mask_uncached)
+
+    def _token_mask_uncached(self, fragment: str) -> int:
+        # Substring search: a fragment can match the middle of any indexed token.
+        matches = [postings for token, postings in self._tokens.items() if fragment in token]
+        return _mask(chain.from_iterable(matches), len(self.projects))
+
+    def _search_mask(self, term: str, candidates: int) -> int:
+        needle = term.lower()
+        mask = candidates
+        for fragment in needle.split():
+            mask &= self._token_mask(fragment)
+            if not mask:
+                return 0
+        # Tokens narrow the candidates; confirm the full phrase on the survivors only.
+        confirmed = (position for position in _iter_bits(mask) if needle in self._haystacks[position])
+        return _mask(confirmed, len(self.projects))
+
+    def filter(
+        self,
+        categories: Iterable[str] = (),
+        technologies: Iterable[str] = (),
+        search: str = "",
+    ) -> list[Project]:
+        """Return projects in any of *categories*, using all *technologies*, matching *search*."""
+        mask = self._all
+
+        categories = list(categories)
+        if categories:
+            category_mask = 0
+            for category in categories:
+                category_mask |= self._by_category.get(category, 0)
+            mask &= category_mask
+
+        for tech in technologies:
+            mask &= self._by_technology.get(tech, 0)
+
+        if search and mask:
+            mask = self._search_mask(search, mask)
+
+        return [self.projects[position] for position in _iter_bits(mask)]
+
+
+_INDEX_CACHE: OrderedDict[int, tuple[Sequence[Project], ProjectIndex]] = OrderedDict()
+_INDEX_CACHE_SIZE = 64
+_INDEX_LOCK = threading.Lock()
+
+
+def index_for(projects: Sequence[Project]) -> ProjectIndex:
+    """Return the shared index for *projects*, building it once per dataset version.
+
+    The content store hands every session the same parsed tuple until the file
+    changes, so the tuple's identity is the dataset version.
+    """
+    key = id(projects)
+    with _INDEX_LOCK:
+        cached = _INDEX_CACHE.get(key)
+        hit = cached is not None and cached[0] is projects
+        if metrics.ENABLED:
+            metrics.count_cache("project_index", hit)
+        if hit:
+            _INDEX_CACHE.move_to_end(key)
+            return cached[1]
+
+    return remember_index(projects, ProjectIndex(projects))
+
+
+def remember_index(projects: Sequence[Project], index: ProjectIndex) -> ProjectIndex:
+    """Store *index* as the index for *projects*, e.g. one built while streaming the file."""
+    with _INDEX_LOCK:
+        _INDEX_CACHE[id(projects)] = (projects, index)
+        _INDEX_CACHE.move_to_end(id(projects))
+        while len(_INDEX_CACHE) > _INDEX_CACHE_SIZE:
+            _INDEX_CACHE.popitem(last=False)
+    return index
+
+
+def forget_index(projects: Any) -> None:
+    """Drop the index cached for *projects*, e.g. when the content store releases them."""
+    with _INDEX_LOCK:
+        cached = _INDEX_CACHE.get(id(projects))
+        if cached is not None and cached[0] is projects:
+            del _INDEX_CACHE[id(projects)]
@@ -0,0 +1,79 @@
+"""In-process rate limiting and duplicate detection for form submissions.
+
+State is shared by every session in the process and bounded: each structure is
+an LRU that evicts its least recently used keys once it reaches capacity, so a
+flood of distinct clients cannot grow memory without limit.
+"""
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+
+class RateLimiter:
+    """Token buckets keyed by an arbitrary string (session id, client address, ...).
+
+    Each key may burst up to *capacity* requests and then gets *refill_rate*
+    tokens back per second.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float, max_keys: int = 10_000) -> None:
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.max_keys = max_keys
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def allow(self, key: str, cost: float = 1.0) -> bool:
+        """Take *cost* tokens from *key*'s bucket; False when it does not hold enough."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (self.capacity, now))
+            tokens = min(self.capacity, tokens + (now - updated) * self.refill_rate)
+            allowed = tokens >= cost
+            if allowed:
+                tokens -= cost
+            self._buckets[key] = (tokens, now)
+            # An evicted key starts again with a full bucket, which errs on the side of letting people in.
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return allowed
+
+
+class RecentSet:
+    """Bounded, expiring set of digests used to spot repeated submissions."""
+
+    def __init__(self, max_entries: int = 10_000, ttl: float = 24 * 3600) -> None:
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._seen: OrderedDict[bytes, float] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(*parts: str) -> bytes:
+        # Normalise case and whitespace so trivial variations still count as the same submission.
+        normalised = "\0".join(" ".join(part.split()).casefold() for part in parts)
+        return hashlib.blake2b(normalised.encode("utf-8"), digest_size=16).digest()
+
+    def add(self, *parts: str) -> bool:
+        """Record *parts*; returns False if they were already seen within the TTL."""
+        key = self.digest(*parts)
+        now = time.monotonic()
+        with self._lock:
+            seen = self._seen.pop(key, None)
+            self._seen[key] = now
+            while len(self._seen) > self.max_entries:
+                self._seen.popitem(last=False)
+        return seen is None or now - seen > self.ttl
+
+    def discard(self, *parts: str) -> None:
+        with self._lock:
+            self._seen.pop(self.digest(*parts), None)
+
+
+# Shared by every session in the process.
+SESSION_LIMITER = RateLimiter(capacity=3, refill_rate=1 / 60, max_keys=10_000)
+CLIENT_LIMITER = RateLimiter(capacity=10, refill_rate=1 / 60, max_keys=10_000)
+RECENT_SUBMISSIONS = RecentSet(max_entries=10_000)
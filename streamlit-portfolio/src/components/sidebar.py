@@ -1,81 +1,117 @@
 from __future__ import annotations
 
+import threading
+from collections import OrderedDict
+from html import escape
 from pathlib import Path
-from typing import Iterable, Mapping
+from typing import Sequence
 
 import streamlit as st
 
+from . import metrics
+from .analytics import recent_achievements
+from .html_fragments import fact_chip, highlight_item, social_link
+from .images import resolve_asset, static_dir
+from .models import Achievement, Profile, Resume, SocialLink, Stat
+from .tenants import DEFAULT_TENANT, Tenant
 
-_ROOT_DIR = Path(__file__).resolve().parents[2]
 
+# Resumes of every tenant share this budget; the least recently downloaded go first.
+_RESUME_BUDGET = 64 * 1024 * 1024
 
-def _render_contact_block(profile: Mapping[str, str]) -> None:
+_RESUME_CACHE: OrderedDict[Path, tuple[int, int, bytes]] = OrderedDict()
+_RESUME_LOCK = threading.Lock()
+
+
+def _resume_bytes(path: Path) -> bytes:
+     """Return the file at *path*, read once per process and again only after it changes."""
+     stat = path.stat()
+     cached = _RESUME_CACHE.get(path)
+     hit = cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size)
+     if metrics.ENABLED:
+          metrics.count_cache("resume_bytes", hit)
+     if hit:
+          with _RESUME_LOCK:
+               if path in _RESUME_CACHE:
+                    _RESUME_CACHE.move_to_end(path)
+          return cached[2]
+
+     data = path.read_bytes()
+     with _RESUME_LOCK:
+          _RESUME_CACHE[path] = (stat.st_mtime_ns, stat.st_size, data)
+          _RESUME_CACHE.move_to_end(path)
+          total = sum(len(entry[2]) for entry in _RESUME_CACHE.values())
+          while total > _RESUME_BUDGET and len(_RESUME_CACHE) > 1:
+               _, evicted = _RESUME_CACHE.popitem(last=False)
+               total -= len(evicted[2])
+     return data
+
+
+def _static_file(name: str) -> Path | None:
+     """Return *name* inside the app's ``static/`` folder when Streamlit serves it at ``app/static/``."""
+     folder = static_dir()
+     return resolve_asset(name, folder) if folder is not None else None
+
+
+def _render_contact_block(profile: Profile) -> None:
      st.markdown("<hr class='sidebar-divider'>", unsafe_allow_html=True)
      st.markdown("#### Let's Connect")
 
-     email = profile.get("email")
-     phone = profile.get("phone")
-     availability = profile.get("availability")
+     email = profile.email
+     phone = profile.phone
+     availability = profile.availability
 
      if availability:
           st.caption(availability)
 
      if email:
-          st.markdown(f"📬 <a href='mailto:{email}' target='_blank'>{email}</a>", unsafe_allow_html=True)
+          st.markdown(f"📬 <a href='mailto:{escape(email)}' target='_blank'>{escape(email)}</a>", unsafe_allow_html=True)
      if phone:
           st.markdown(f"📱 {phone}")
 
 
-def _render_quick_facts(facts: Iterable[Mapping[str, str]]) -> None:
+def _render_quick_facts(facts: Sequence[Stat]) -> None:
      if not facts:
           return
 
      st.markdown("<hr class='sidebar-divider'>", unsafe_allow_html=True)
      st.markdown("#### Quick Facts")
      for fact in facts:
-          label = fact.get("label", "")
-          value = fact.get("value", "")
-          hint = fact.get("hint", "")
-          icon = fact.get("icon", "")
-          st.markdown(
-               f"<div class='fact-chip'>{icon} <strong>{value}</strong><span>{label}</span><small>{hint}</small></div>",
-               unsafe_allow_html=True,
-          )
+          st.markdown(fact_chip(fact), unsafe_allow_html=True)
 
 
-def _render_socials(socials: Iterable[Mapping[str, str]]) -> None:
+def _render_socials(socials: Sequence[SocialLink]) -> None:
      if not socials:
           return
 
      st.markdown("<hr class='sidebar-divider'>", unsafe_allow_html=True)
      st.markdown("#### Socials")
      for entry in socials:
-          label = entry.get("label", "Connect")
-          url = entry.get("url", "#")
-          icon = entry.get("icon", "🔗")
-          st.markdown(f"{icon} <a href='{url}' target='_blank'>{label}</a>", unsafe_allow_html=True)
+          st.markdown(social_link(entry), unsafe_allow_html=True)
 
 
-def _render_resume(resume_info: Mapping[str, str]) -> None:
-     if not resume_info:
-          return
-
-     rel_path = resume_info.get("file")
-     note = resume_info.get("note")
+def _render_resume(resume_info: Resume, tenant: Tenant) -> None:
+     rel_path = resume_info.file
+     note = resume_info.note
 
      if not rel_path:
           return
 
-     candidate = _ROOT_DIR / "assets" / rel_path
-     if candidate.exists():
-          with candidate.open("rb") as resume_handle:
-               st.download_button(
-                    "📄 Download CV",
-                    data=resume_handle.read(),
-                    file_name=rel_path,
-                    mime="application/pdf",
-                    type="primary",
-               )
+     # Anything that resolves outside the tenant's assets/ (e.g. "../..") is refused.
+     candidate = resolve_asset(rel_path, tenant.assets_dir)
+     # Tenants publish static files under their own ``static/<slug>/`` folder.
+     static_name = f"{tenant.slug}/{rel_path}" if tenant.slug else rel_path
+     if _static_file(static_name) is not None:
+          # The browser fetches the file itself, so no bytes go through the session.
+          st.link_button("📄 Download CV", f"app/static/{static_name}", type="primary")
+     elif candidate is not None:
+          st.download_button(
+               "📄 Download CV",
+               data=_resume_bytes(candidate),
+               file_name=candidate.name,
+               mime="application/pdf",
+               type="primary",
+          )
      else:
           st.markdown(
                "<div class='resume-note'>Add your latest CV to `assets/` to enable downloads.</div>",
@@ -86,34 +122,30 @@ def _render_resume(resume_info: Mapping[str, str]) -> None:
           st.caption(note)
 
 
-def render_sidebar(profile: Mapping[str, str], achievements: Iterable[Mapping[str, str]]) -> None:
+@metrics.instrumented("render_sidebar")
+def render_sidebar(profile: Profile, achievements: Sequence[Achievement], tenant: Tenant = DEFAULT_TENANT) -> None:
      """Render the global sidebar used across all pages."""
 
      with st.sidebar:
           st.markdown(
-               "<div class='sidebar-hero'><span>👋</span><h2>Jared Sheohn Acebes</h2><p>AI Trainee Developer · Community Leader · Full-Stack Builder</p></div>",
+               f"<div class='sidebar-hero'><span>👋</span><h2>{escape(profile.name)}</h2><p>{escape(profile.tagline)}</p></div>",
                unsafe_allow_html=True,
           )
 
-          location = profile.get("location")
-          if location:
-               st.markdown(f"📍 {location}")
+          if profile.location:
+               st.markdown(f"📍 {profile.location}")
 
-          summary = profile.get("sidebar_summary")
-          if summary:
-               st.caption(summary)
+          if profile.sidebar_summary:
+               st.caption(profile.sidebar_summary)
 
-          _render_resume(profile.get("resume", {}))
-          _render_quick_facts(profile.get("quick_stats", []))
+          _render_resume(profile.resume, tenant)
+          _render_quick_facts(profile.quick_stats)
 
           if achievements:
                st.markdown("<hr class='sidebar-divider'>", unsafe_allow_html=True)
                st.markdown("#### Recent Highlights")
-               for item in list(achievements)[:3]:
-                    st.markdown(
-                         f"<div class='highlight-item'><strong>{item.get('year')}</strong> · {item.get('title')}</div>",
-                         unsafe_allow_html=True,
-                    )
+               for item in recent_achievements(achievements)[:3]:
+                    st.markdown(highlight_item(item), unsafe_allow_html=True)
 
-          _render_socials(profile.get("social_links", []))
+          _render_socials(profile.social_links)
           _render_contact_block(profile)
\ No newline at end of file
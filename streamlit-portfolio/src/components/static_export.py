@@ -0,0 +1,463 @@
+"""Pre-render the portfolio into a static HTML/CSS bundle a CDN can serve.
+
+The bundle follows the same sections as the Streamlit app (sidebar, About,
+Portfolio, Contact) and reads the same data files through the content store.
+Project filtering, search and "Load more" run client-side with the same rules
+as ``ProjectIndex.filter``. The stylesheet is written under a content-hashed
+name so it can be cached indefinitely.
+
+Run from the ``src`` directory::
+
+    python -m components.static_export ../build/site
+    python -m components.static_export ../build/site --app-url https://portfolio.example.com
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import shutil
+import sys
+from html import escape
+from pathlib import Path
+from typing import Mapping, Sequence
+
+from styles.theme import THEME_PATH, load_stylesheet
+
+from .analytics import AchievementStats, achievement_stats, recent_testimonials
+from .data_loader import ContentStore, data_dir, load_achievements, load_profile, load_projects, load_testimonials
+from .html_fragments import chip_row, fact_chip, highlight_item, social_link
+from .images import ASSETS_DIR, Variant, build_variants, resolve_asset
+from .models import Achievement, Profile, Project, Testimonial
+from .portfolio_gallery import CARD_IMAGE_WIDTH, PAGE_SIZE
+from .project_index import index_for
+from .svg_charts import radar_svg, stacked_bars_svg
+
+
+# Page layout for the static bundle; theme.css only styles the content itself.
+_LAYOUT_CSS = """
+body{margin:0;color:#E2E8F0}
+.site{display:grid;grid-template-columns:minmax(220px,300px) 1fr;gap:2rem;max-width:1280px;margin:0 auto;padding:2rem}
+.site aside{position:sticky;top:2rem;align-self:start}
+.site nav a{margin-right:1rem}
+.site section{margin-bottom:3rem}
+.stContainer{margin-bottom:1rem}
+.stContainer>div{padding:1rem 1.25rem}
+.card-head{display:flex;justify-content:space-between;gap:1rem}
+.muted{color:#94A3B8;font-size:.9rem}
+.metrics{display:flex;gap:1rem;flex-wrap:wrap}
+.metric-container{padding:.75rem 1rem}
+.stProgress>div>div{background:rgba(148,163,184,.3);border-radius:4px;height:6px}
+.stProgress>div>div>div{height:6px;border-radius:4px}
+.filters{display:flex;gap:1rem;flex-wrap:wrap;margin-bottom:1rem}
+.filters select{min-width:200px}
+.skill-radar{max-width:360px}
+.timeline-chart{max-width:720px}
+.testimonials{display:grid;grid-template-columns:repeat(auto-fill,minmax(240px,1fr));gap:1rem}
+.project-card img{width:100%;height:auto;border-radius:8px}
+@media (max-width:800px){.site{grid-template-columns:1fr}.site aside{position:static}}
+"""
+
+# Mirrors ProjectIndex.filter: any selected category, every selected technology,
+# and every search word on the tokens plus the full phrase on the text.
+_GALLERY_JS = """
+(function(){
+var cards=[].slice.call(document.querySelectorAll('.project-card'));
+var cats=document.getElementById('filter-category'),techs=document.getElementById('filter-technology'),
+search=document.getElementById('filter-search'),more=document.getElementById('load-more'),
+empty=document.getElementById('no-match'),count=document.getElementById('match-count');
+var pageSize=PAGE_SIZE,visible=pageSize,matches=[];
+function picked(select){return [].filter.call(select.options,function(o){return o.selected}).map(function(o){return o.value})}
+function tokenMatch(tokens,word){return tokens.some(function(t){return t.indexOf(word)!==-1})}
+function apply(){
+  var c=picked(cats),t=picked(techs),needle=search.value.trim().toLowerCase(),words=needle.split(/\\s+/).filter(Boolean);
+  matches=cards.filter(function(card){
+    var d=card.dataset,own=d.technologies?d.technologies.split('|'):[];
+    if(c.length&&c.indexOf(d.category)===-1)return false;
+    if(!t.every(function(x){return own.indexOf(x)!==-1}))return false;
+    if(!needle)return true;
+    var tokens=d.search.split(' ');
+    return words.every(function(w){return tokenMatch(tokens,w)})&&d.search.indexOf(needle)!==-1;
+  });
+  render();
+}
+function render(){
+  cards.forEach(function(card){card.hidden=true});
+  matches.slice(0,visible).forEach(function(card){card.hidden=false});
+  empty.hidden=matches.length>0;
+  var remaining=matches.length-Math.min(visible,matches.length);
+  more.hidden=count.hidden=remaining<=0;
+  more.textContent='Load '+Math.min(pageSize,remaining)+' more';
+  count.textContent='Showing '+Math.min(visible,matches.length)+' of '+matches.length+' projects';
+}
+function reset(){visible=pageSize;apply()}
+cats.addEventListener('change',reset);techs.addEventListener('change',reset);search.addEventListener('input',reset);
+more.addEventListener('click',function(){visible+=pageSize;render()});
+apply();
+})();
+"""
+
+
+def _text(value: str, tag: str = "p", css_class: str = "") -> str:
+    if not value:
+        return ""
+    attribute = f" class='{css_class}'" if css_class else ""
+    return f"<{tag}{attribute}>{escape(value)}</{tag}>"
+
+
+def _bullets(items: Sequence[str]) -> str:
+    if not items:
+        return ""
+    return "<ul>" + "".join(f"<li>{escape(item)}</li>" for item in items) + "</ul>"
+
+
+def _sidebar(profile: Profile, achievements: Sequence[Achievement], resume_href: str | None) -> str:
+    parts = [
+        "<div class='sidebar-hero'><span>👋</span>",
+        _text(profile.name, "h2"),
+        _text(profile.tagline, "p"),
+        "</div>",
+        "<nav><a href='#about'>About</a><a href='#portfolio'>Portfolio</a><a href='#contact'>Contact</a></nav>",
+    ]
+    if profile.location:
+        parts.append(f"<p>📍 {escape(profile.location)}</p>")
+    parts.append(_text(profile.sidebar_summary, "p", "muted"))
+    if resume_href:
+        parts.append(f"<p><a href='{escape(resume_href)}' download>📄 Download CV</a></p>")
+    parts.append(_text(profile.resume.note, "p", "muted"))
+
+    if profile.quick_stats:
+        parts.append("<hr class='sidebar-divider'><h4>Quick Facts</h4>")
+        parts.extend(fact_chip(fact) for fact in profile.quick_stats)
+    if achievements:
+        parts.append("<hr class='sidebar-divider'><h4>Recent Highlights</h4>")
+        parts.extend(highlight_item(item) for item in achievements[:3])
+    if profile.social_links:
+        parts.append("<hr class='sidebar-divider'><h4>Socials</h4>")
+        parts.extend(f"<p>{social_link(link)}</p>" for link in profile.social_links)
+
+    parts.append("<hr class='sidebar-divider'><h4>Let's Connect</h4>")
+    parts.append(_text(profile.availability, "p", "muted"))
+    if profile.email:
+        email = escape(profile.email)
+        parts.append(f"<p>📬 <a href='mailto:{email}'>{email}</a></p>")
+    if profile.phone:
+        parts.append(f"<p>📱 {escape(profile.phone)}</p>")
+    return "".join(parts)
+
+
+def _timeline(stats: AchievementStats) -> str:
+    """The "Milestones by Year" chart and category chips, as in ``render_achievement_timeline``."""
+    if stats.timeline.empty:
+        return ""
+    first, last = stats.by_year[0][0], stats.by_year[-1][0]
+    series = tuple(str(column) for column in stats.timeline.columns)
+    bars = tuple(
+        (str(year), tuple(float(value) for value in row))
+        for year, row in zip(stats.timeline.index, stats.timeline.to_numpy().tolist())
+    )
+    return (
+        "<h4>Milestones by Year</h4>"
+        f"<p class='muted'>{int(stats.timeline.to_numpy().sum())} dated achievements, {first}–{last}</p>"
+        f"{stacked_bars_svg(series, bars)}{chip_row(stats.category_labels, 'focus-chip', 'focus-chip-row')}"
+    )
+
+
+def _testimonials(testimonials: Sequence[Testimonial], limit: int = 6) -> str:
+    """The newest testimonials, as in ``render_testimonials``."""
+    if not testimonials:
+        return ""
+    parts = ["<h3>What People Say</h3><div class='testimonials'>"]
+    for item in recent_testimonials(tuple(testimonials))[:limit]:
+        caption = " · ".join(part for part in (f"— {item.name}", item.role, item.year) if part)
+        parts.append(f"<div>{_text(item.content, 'blockquote')}{_text(caption, 'p', 'muted')}</div>")
+    parts.append("</div>")
+    return "".join(parts)
+
+
+def _about(profile: Profile, stats: AchievementStats, testimonials: Sequence[Testimonial]) -> str:
+    parts = ["<section id='about'><h3>Hi, I'm ", escape(profile.name.split(" ")[0] or "there"), " 👋</h3>"]
+    parts.append(_text(profile.tagline, "h2"))
+    parts.append(_bullets(profile.summary_points))
+    parts.append(chip_row(profile.focus_areas, "focus-chip", "focus-chip-row"))
+    if profile.quick_stats:
+        parts.append("<h4>Snapshot</h4><div class='metrics'>")
+        for stat in profile.quick_stats[:3]:
+            parts.append(
+                f"<div class='metric-container'><div class='muted'>{escape(stat.label)}</div>"
+                f"<strong>{escape(stat.value)}</strong>{_text(stat.hint, 'div', 'muted')}</div>"
+            )
+        parts.append("</div>")
+    parts.append(_text(profile.hero_quote, "blockquote"))
+
+    if stats.recent:
+        parts.append("<h3>Spotlight Achievements</h3><div class='metrics'>")
+        for achievement in stats.recent[:6]:
+            parts.append(
+                f"<div class='metric-container'><strong>{escape(achievement.year)}</strong>"
+                f"{_text(achievement.issuer, 'div', 'muted')}{_text(achievement.title)}</div>"
+            )
+        parts.append("</div>")
+        parts.append(_timeline(stats))
+
+    if profile.experience:
+        parts.append("<h3>Professional Journey</h3>")
+        for exp in profile.experience:
+            parts.append(
+                f"<div class='stContainer'><div><div class='muted'>{escape(exp.start)} – {escape(exp.end)}</div>"
+                f"<strong>{escape(exp.company)}</strong>{_text(exp.title, 'h4')}{_text(exp.summary)}"
+                f"{_bullets(exp.highlights)}{chip_row(exp.stack)}</div></div>"
+            )
+
+    categories = profile.leadership.categories
+    parts.append("<h3>Leadership & Service</h3>")
+    if not categories:
+        parts.append("<p class='muted'>Leadership stories coming soon.</p>")
+    for category in categories:
+        parts.append(_text(category.name, "h4"))
+        for role in category.items:
+            parts.append(
+                f"<div class='stContainer'><div>{_text(role.role, 'h4')}"
+                f"<div class='muted'>{escape(role.organization)} · {escape(role.duration)}</div>"
+                f"{_text(role.scope)}{_bullets(role.highlights)}</div></div>"
+            )
+
+    skills = profile.skills
+    parts.append("<h3>Skill Showcase</h3>")
+    for category in skills.categories:
+        parts.append(_text(category.name, "h4") + chip_row(category.items))
+    points = tuple((entry.label, entry.score) for entry in skills.radar)
+    if any(score for _, score in points):
+        parts.append(radar_svg(points))
+    if skills.toolkit:
+        parts.append("<h4>Toolkit Sweet Spot</h4>" + _bullets(skills.toolkit))
+    if skills.soft_skills:
+        parts.append("<details><summary>Team & Personal Strengths</summary>" + _bullets(skills.soft_skills) + "</details>")
+
+    if profile.education:
+        parts.append("<h3>Education</h3>")
+        for entry in profile.education:
+            parts.append(
+                f"<p><strong>{escape(entry.institution)}</strong> · {escape(entry.duration)}</p>"
+                f"{_text(entry.program, 'p', 'muted')}"
+            )
+    if profile.certifications:
+        parts.append("<h3>Certifications & Trainings</h3>" + _bullets(profile.certifications))
+    parts.append(_testimonials(testimonials))
+    parts.append(_text(profile.call_to_action, "p", "stSuccess"))
+    parts.append("</section>")
+    return "".join(parts)
+
+
+def _picture(variants: Sequence[Variant], urls: Mapping[Path, str], alt: str) -> str:
+    """``<picture>`` with a WebP ``srcset`` and the JPEG/PNG variants as the fallback ``<img>``."""
+    by_format: dict[str, list[Variant]] = {}
+    for variant in variants:
+        by_format.setdefault(variant.format, []).append(variant)
+    fallback = [variant for variant in variants if variant.format != "webp"] or variants
+
+    def srcset(items: Sequence[Variant]) -> str:
+        return ", ".join(f"{escape(urls[item.path])} {item.width}w" for item in items)
+
+    sizes = f"(max-width: 800px) 100vw, {CARD_IMAGE_WIDTH}px"
+    webp = by_format.get("webp")
+    source = f"<source type='image/webp' srcset='{srcset(webp)}' sizes='{sizes}'>" if webp and fallback is not webp else ""
+    return (
+        f"<picture>{source}<img src='{escape(urls[fallback[0].path])}' srcset='{srcset(fallback)}' "
+        f"sizes='{sizes}' alt='{escape(alt)}' loading='lazy' decoding='async'></picture>"
+    )
+
+
+def _project_card(project: Project, picture: str = "") -> str:
+    haystack = " ".join([project.name, project.summary, " ".join(project.highlights)]).lower()
+    parts = [
+        f"<article class='project-card stContainer' hidden data-category='{escape(project.category)}' "
+        f"data-technologies='{escape('|'.join(project.technologies))}' data-search='{escape(haystack)}'><div>",
+        "<div class='card-head'><div>",
+        _text(project.name, "h3"),
+    ]
+    if project.role or project.year:
+        parts.append(f"<div class='muted'>{escape(project.role)} · {escape(project.year)}</div>")
+    parts.append(_text(project.summary))
+    parts.append(chip_row(project.technologies))
+    parts.append("</div><div>")
+    parts.append(picture)
+    parts.append(_text(project.status, "div", "stSuccess"))
+    if project.maturity:
+        parts.append(f"<div class='stProgress'><div><div><div style='width:{project.maturity}%'></div></div></div></div>")
+    parts.append(_text(project.impact, "div", "muted"))
+    parts.append("</div></div>")
+    if project.highlights:
+        parts.append("<details><summary>What made this special</summary>" + _bullets(project.highlights) + "</details>")
+    if project.links:
+        links = " • ".join(f"<a href='{escape(url)}'>{escape(label.title())}</a>" for label, url in project.links)
+        parts.append(f"<p>{links}</p>")
+    parts.append("</div></article>")
+    return "".join(parts)
+
+
+def _options(values: Sequence[str], selected: Sequence[str] = ()) -> str:
+    return "".join(
+        f"<option value='{escape(value)}'{' selected' if value in selected else ''}>{escape(value)}</option>"
+        for value in values
+    )
+
+
+def _portfolio(projects: Sequence[Project], pictures: Mapping[str, str]) -> str:
+    parts = ["<section id='portfolio'><h3>Featured Projects</h3>"]
+    if not projects:
+        parts.append("<p class='muted'>Projects will appear here once you add them to <code>src/data/projects.yaml</code>.</p>")
+        return "".join(parts) + "</section>"
+
+    index = index_for(projects)
+    # Same default as the app: start on the first focus area.
+    parts.append(
+        "<div class='filters'>"
+        f"<label>Filter by focus area<br><select id='filter-category' multiple>{_options(index.categories, index.categories[:1])}</select></label>"
+        f"<label>Filter by technology<br><select id='filter-technology' multiple>{_options(index.technologies)}</select></label>"
+        "<label>Search<br><input id='filter-search' type='search' placeholder=\"Try 'LangChain' or 'relief'\"></label>"
+        "</div>"
+    )
+    parts.extend(_project_card(project, pictures.get(project.image, "")) for project in projects)
+    parts.append(
+        "<p id='no-match' class='stWarning' hidden>No projects match the current filters—try broadening your selection.</p>"
+        "<p id='match-count' class='muted' hidden></p><button id='load-more' type='button' hidden>Load more</button>"
+    )
+    parts.append("</section>")
+    return "".join(parts)
+
+
+def _contact(profile: Profile, app_url: str | None) -> str:
+    parts = ["<section id='contact'><h3>Get in touch</h3>"]
+    if app_url:
+        parts.append(f"<p><a href='{escape(app_url)}'>Send a message through the live app</a></p>")
+    if profile.email:
+        email = escape(profile.email)
+        parts.append(f"<p>Or e-mail <a href='mailto:{email}'>{email}</a>.</p>")
+    parts.append("</section>")
+    return "".join(parts)
+
+
+def render_site(
+    profile: Profile,
+    projects: Sequence[Project],
+    achievements: Sequence[Achievement],
+    stylesheet_href: str,
+    resume_href: str | None = None,
+    app_url: str | None = None,
+    pictures: Mapping[str, str] | None = None,
+    testimonials: Sequence[Testimonial] = (),
+) -> str:
+    """Return the complete ``index.html`` document for the given content.
+
+    *pictures* maps a project's ``image`` to its ready-made ``<picture>`` markup.
+    """
+    title = f"{profile.name} — Portfolio" if profile.name else "Portfolio"
+    # Same newest-first order, rollups and timeline as the live sidebar and About page.
+    stats = achievement_stats(tuple(achievements))
+    script = f"<script>{_GALLERY_JS.replace('PAGE_SIZE', json.dumps(PAGE_SIZE))}</script>" if projects else ""
+    return (
+        "<!DOCTYPE html><html lang='en'><head><meta charset='utf-8'>"
+        "<meta name='viewport' content='width=device-width, initial-scale=1'>"
+        f"<title>{escape(title)}</title><link rel='stylesheet' href='{escape(stylesheet_href)}'></head>"
+        "<body class='stApp'><div class='site'>"
+        f"<aside>{_sidebar(profile, stats.recent, resume_href)}</aside>"
+        f"<main>{_about(profile, stats, testimonials)}{_portfolio(projects, pictures or {})}{_contact(profile, app_url)}</main>"
+        f"</div>{script}</body></html>"
+    )
+
+
+def _export_pictures(projects: Sequence[Project], target: Path, assets_dir: Path = ASSETS_DIR) -> dict[str, str]:
+    """Copy every project screenshot's variants into ``images/`` and return their markup."""
+    pictures: dict[str, str] = {}
+    for project in projects:
+        if not project.image or project.image in pictures:
+            continue
+        source = resolve_asset(project.image, assets_dir)
+        if source is None:
+            continue
+        try:
+            variants = build_variants(source)
+        except OSError:
+            continue
+
+        urls: dict[Path, str] = {}
+        (target / "images").mkdir(exist_ok=True)
+        for variant in variants:
+            # The cache folder is named after the source hash, so the file name is content-addressed too.
+            name = f"{variant.path.parent.name}-{variant.path.name}"
+            if not (target / "images" / name).exists():
+                shutil.copyfile(variant.path, target / "images" / name)
+            urls[variant.path] = f"images/{name}"
+        pictures[project.image] = _picture(variants, urls, project.name)
+    return pictures
+
+
+def export_site(
+    target: Path,
+    root: Path | None = None,
+    app_url: str | None = None,
+    theme_path: Path = THEME_PATH,
+    assets_dir: Path | None = None,
+) -> Path:
+    """Write ``index.html``, a fingerprinted stylesheet and the resume to *target*.
+
+    The resume and project images are read from *assets_dir*, which defaults to
+    ``assets/`` for the bundled data and to ``<root>/assets`` (the tenant layout)
+    for any other data directory. Paths that leave it are skipped.
+
+    Returns the path of ``index.html``.
+    """
+    if assets_dir is None:
+        assets_dir = ASSETS_DIR if root is None else Path(root) / "assets"
+    store = ContentStore(Path(root) if root is not None else data_dir(), snapshots=root is None)
+    profile = load_profile(store)
+    projects = load_projects(store)
+    achievements = load_achievements(store)
+    testimonials = load_testimonials(store)
+
+    target = Path(target)
+    target.mkdir(parents=True, exist_ok=True)
+
+    stylesheet = load_stylesheet(theme_path)
+    css = (stylesheet.css if stylesheet else "") + _LAYOUT_CSS.replace("\n", "")
+    fingerprint = stylesheet.fingerprint if stylesheet else "layout"
+    stylesheet_name = f"theme.{fingerprint}.css"
+    (target / stylesheet_name).write_text(css, encoding="utf-8")
+
+    resume_href = None
+    resume = resolve_asset(profile.resume.file, assets_dir)
+    if resume is not None:
+        shutil.copyfile(resume, target / resume.name)
+        resume_href = resume.name
+
+    pictures = _export_pictures(projects, target, assets_dir)
+
+    index = target / "index.html"
+    index.write_text(
+        render_site(profile, projects, achievements, stylesheet_name, resume_href, app_url, pictures, testimonials),
+        encoding="utf-8",
+    )
+    return index
+
+
+def _main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m components.static_export")
+    parser.add_argument("target", type=Path, help="output directory for the static bundle")
+    parser.add_argument("--data-dir", type=Path, default=None, help="defaults to src/data")
+    parser.add_argument("--app-url", default=None, help="live Streamlit app to link from the Contact section")
+    parser.add_argument(
+        "--assets-dir", type=Path, default=None, help="resume and project images; defaults to assets/, or <data-dir>/assets"
+    )
+    args = parser.parse_args(argv)
+
+    try:
+        index = export_site(args.target, args.data_dir, args.app_url, assets_dir=args.assets_dir)
+    except ValueError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    print(f"Wrote {index}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(_main())
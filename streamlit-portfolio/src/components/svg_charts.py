@@ -0,0 +1,121 @@
+"""Dependency-free SVG renderings of the portfolio charts."""
+from __future__ import annotations
+
+import math
+from functools import lru_cache
+from html import escape
+
+from . import metrics
+
+
+RadarPoints = tuple[tuple[str, float], ...]
+# (label, one value per series) for each bar, left to right.
+StackedBars = tuple[tuple[str, tuple[float, ...]], ...]
+
+# Series colours, reused in order when there are more series than colours.
+_PALETTE = ("#4F46E5", "#0EA5E9", "#10B981", "#F59E0B", "#EF4444", "#A855F7", "#EC4899", "#64748B")
+
+
+@lru_cache(maxsize=32)
+def radar_svg(points: RadarPoints, size: int = 320, color: str = "#4F46E5") -> str:
+    """Return an inline SVG radar chart for ``(label, score)`` pairs scored 0–100."""
+    if len(points) < 3:
+        return ""
+
+    center = size / 2
+    radius = size / 2 - 60
+    count = len(points)
+
+    def vertex(position: int, scale: float) -> tuple[float, float]:
+        angle = -math.pi / 2 + 2 * math.pi * position / count
+        return center + radius * scale * math.cos(angle), center + radius * scale * math.sin(angle)
+
+    def polygon(scales: list[float]) -> str:
+        return " ".join(f"{x:.1f},{y:.1f}" for x, y in (vertex(i, scale) for i, scale in enumerate(scales)))
+
+    parts = [
+        f"<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 {size} {size}' width='100%' "
+        "role='img' aria-label='Skill radar' class='skill-radar'>"
+    ]
+    for ring in (0.25, 0.5, 0.75, 1.0):
+        parts.append(f"<polygon points='{polygon([ring] * count)}' fill='none' stroke='#64748B' stroke-opacity='0.4'/>")
+    for position in range(count):
+        x, y = vertex(position, 1.0)
+        parts.append(
+            f"<line x1='{center:.1f}' y1='{center:.1f}' x2='{x:.1f}' y2='{y:.1f}' stroke='#64748B' stroke-opacity='0.4'/>"
+        )
+
+    scores = [max(0.0, min(float(score), 100.0)) / 100 for _, score in points]
+    parts.append(
+        f"<polygon points='{polygon(scores)}' fill='{color}' fill-opacity='0.35' stroke='{color}' stroke-width='2'/>"
+    )
+
+    for position, (label, _) in enumerate(points):
+        x, y = vertex(position, 1.18)
+        anchor = "middle" if abs(x - center) < 1 else ("start" if x > center else "end")
+        parts.append(
+            f"<text x='{x:.1f}' y='{y:.1f}' text-anchor='{anchor}' dominant-baseline='middle' "
+            f"font-size='12' fill='#E2E8F0'>{escape(str(label))}</text>"
+        )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+@lru_cache(maxsize=32)
+def stacked_bars_svg(series: tuple[str, ...], bars: StackedBars, width: int = 640, height: int = 260) -> str:
+    """Return an inline SVG stacked bar chart with a legend, like ``st.bar_chart`` on a wide frame."""
+    if not bars or not series:
+        return ""
+
+    top, bottom, left, legend_row = 12, 28, 32, 20
+    legend_rows = math.ceil(len(series) / 4)
+    plot_height = height - top - bottom
+    slot = (width - left) / len(bars)
+    bar_width = slot * 0.7
+    peak = max(sum(values) for _, values in bars) or 1
+
+    parts = [
+        f"<svg xmlns='http://www.w3.org/2000/svg' viewBox='0 0 {width} {height + legend_rows * legend_row}' "
+        "width='100%' role='img' aria-label='Milestones by year' class='timeline-chart'>"
+    ]
+    for step in range(5):
+        value = peak * step / 4
+        y = top + plot_height * (1 - step / 4)
+        parts.append(f"<line x1='{left}' y1='{y:.1f}' x2='{width}' y2='{y:.1f}' stroke='#64748B' stroke-opacity='0.3'/>")
+        parts.append(
+            f"<text x='{left - 6}' y='{y:.1f}' text-anchor='end' dominant-baseline='middle' "
+            f"font-size='11' fill='#94A3B8'>{value:g}</text>"
+        )
+
+    for position, (label, values) in enumerate(bars):
+        x = left + slot * position + (slot - bar_width) / 2
+        base = top + plot_height
+        for index, value in enumerate(values):
+            if value <= 0:
+                continue
+            bar_height = plot_height * value / peak
+            base -= bar_height
+            parts.append(
+                f"<rect x='{x:.1f}' y='{base:.1f}' width='{bar_width:.1f}' height='{bar_height:.1f}' "
+                f"fill='{_PALETTE[index % len(_PALETTE)]}'><title>{escape(str(label))} · "
+                f"{escape(series[index])}: {value:g}</title></rect>"
+            )
+        parts.append(
+            f"<text x='{x + bar_width / 2:.1f}' y='{top + plot_height + 16}' text-anchor='middle' "
+            f"font-size='11' fill='#E2E8F0'>{escape(str(label))}</text>"
+        )
+
+    for index, name in enumerate(series):
+        x = left + (width - left) / 4 * (index % 4)
+        y = height + legend_row * (index // 4)
+        parts.append(f"<rect x='{x:.1f}' y='{y}' width='10' height='10' fill='{_PALETTE[index % len(_PALETTE)]}'/>")
+        parts.append(
+            f"<text x='{x + 16:.1f}' y='{y + 5}' dominant-baseline='middle' font-size='11' "
+            f"fill='#E2E8F0'>{escape(name)}</text>"
+        )
+    parts.append("</svg>")
+    return "".join(parts)
+
+
+metrics.register_lru_cache("radar_svg", radar_svg)
+metrics.register_lru_cache("stacked_bars_svg", stacked_bars_svg)
@@ -0,0 +1,67 @@
+"""Serve many portfolios from one deployment, selected with ``?tenant=<slug>``.
+
+Set ``PORTFOLIO_TENANTS_DIR`` to a directory with one folder per portfolio::
+
+    tenants/
+        ada/
+            profile.yaml  projects.yaml  achievements.yaml  testimonials.yaml
+            theme.css     # optional, replaces the default theme
+            assets/       # optional, resume and project images
+        grace/
+            ...
+
+Without the variable, or without a ``tenant`` parameter, the app serves the
+default portfolio from ``src/data``. Content, themes and assets are cached per
+tenant in bounded process-wide caches (see ``data_loader.store_for``), so idle
+portfolios cost nothing beyond their files on disk.
+"""
+from __future__ import annotations
+
+import os
+import re
+from dataclasses import dataclass
+from pathlib import Path
+
+from styles.theme import THEME_PATH
+
+from .data_loader import ContentStore, data_dir, store_for
+
+
+ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
+
+_SLUG = re.compile(r"[a-z0-9][a-z0-9_-]{0,62}")
+
+
+@dataclass(frozen=True, slots=True)
+class Tenant:
+    slug: str
+    data_dir: Path
+    assets_dir: Path
+    theme_path: Path
+
+    @property
+    def store(self) -> ContentStore:
+        return store_for(self.data_dir)
+
+
+DEFAULT_TENANT = Tenant("", data_dir(), ASSETS_DIR, THEME_PATH)
+
+
+def tenants_dir() -> Path | None:
+    configured = os.environ.get("PORTFOLIO_TENANTS_DIR")
+    return Path(configured) if configured else None
+
+
+def resolve_tenant(slug: str | None) -> Tenant | None:
+    """Return the tenant for *slug*, the default for an empty slug, or None if it does not exist."""
+    if not slug:
+        return DEFAULT_TENANT
+    root = tenants_dir()
+    if root is None or not _SLUG.fullmatch(slug):
+        return None
+    folder = root / slug
+    if not folder.is_dir():
+        return None
+
+    theme = folder / "theme.css"
+    return Tenant(slug, folder, folder / "assets", theme if theme.is_file() else THEME_PATH)
@@ -0,0 +1,114 @@
+"""Load the theme stylesheet once per process, minified and content-hashed."""
+from __future__ import annotations
+
+import hashlib
+import json
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+
+THEME_PATH = Path(__file__).resolve().with_name("theme.css")
+
+# Comments and quoted strings, found in one pass so quotes inside comments and
+# "/*" inside strings are not mistaken for the other. Strings are kept verbatim.
+_TOKENS = re.compile(r"""/\*.*?\*/|(?P<string>"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""", re.DOTALL)
+_WHITESPACE = re.compile(r"\s+")
+# A comment between two characters that are not one of these (or whitespace)
+# separates two tokens, as in "margin:0/**/auto", and is replaced by a space.
+_SEPARATORS = frozenset("{}[]();:,>+~*/=!\"'")
+# Spaces around these are never significant. Only the space after ":" goes,
+# because "a :hover" and "a:hover" are different selectors.
+_PUNCTUATION = re.compile(r"\s*([{};,>])\s*|(:)\s+")
+
+
+@dataclass(frozen=True)
+class Stylesheet:
+    css: str
+    fingerprint: str
+
+    @property
+    def injection_script(self) -> str:
+        """HTML that installs the stylesheet into the parent page's ``<head>``.
+
+        The ``<style>`` element outlives the component iframe, so a session only
+        needs to send it once; a new fingerprint replaces the previous contents.
+        """
+        css = json.dumps(self.css).replace("</", "<\\/")
+        return (
+            "<script>(function () {"
+            "const doc = window.parent.document;"
+            "let style = doc.getElementById('portfolio-theme');"
+            "if (!style) { style = doc.createElement('style'); style.id = 'portfolio-theme'; doc.head.appendChild(style); }"
+            f"if (style.dataset.fingerprint !== '{self.fingerprint}') {{"
+            f"style.textContent = {css}; style.dataset.fingerprint = '{self.fingerprint}'; }}"
+            "})();</script>"
+        )
+
+
+def _minify_code(css: str) -> str:
+    css = _WHITESPACE.sub(" ", css)
+    css = _PUNCTUATION.sub(lambda match: match.group(1) or match.group(2), css)
+    return css.replace(";}", "}")
+
+
+def _separates(before: str, after: str) -> bool:
+    return all(char and not char.isspace() and char not in _SEPARATORS for char in (before, after))
+
+
+def minify_css(source: str) -> str:
+    """Return *source* without comments and insignificant whitespace.
+
+    >>> minify_css('a { content: "a, b ; c" ; }')
+    'a{content:"a, b ; c"}'
+    >>> minify_css("p { margin:0/**/auto; color:red/* note */; }")
+    'p{margin:0 auto;color:red}'
+    """
+    parts: list[str] = []
+    code: list[str] = []
+    position = 0
+    for match in _TOKENS.finditer(source):
+        code.append(source[position:match.start()])
+        position = match.end()
+        if match.group("string") is None:
+            if _separates(source[match.start() - 1 : match.start()], source[match.end() : match.end() + 1]):
+                code.append(" ")
+        else:
+            parts.append(_minify_code("".join(code)))
+            parts.append(match.group("string"))
+            code = []
+    code.append(source[position:])
+    parts.append(_minify_code("".join(code)))
+    return "".join(parts).strip()
+
+
+# One entry per theme file (the default plus one per tenant that ships its own), least recently used first.
+_CACHE: OrderedDict[Path, tuple[int, int, Stylesheet]] = OrderedDict()
+_CACHE_SIZE = 256
+_LOCK = threading.Lock()
+
+
+def load_stylesheet(path: Path = THEME_PATH) -> Stylesheet | None:
+    """Return the minified stylesheet at *path*, rebuilding it only when the file changes."""
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    cached = _CACHE.get(path)
+    if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+        with _LOCK:
+            if path in _CACHE:
+                _CACHE.move_to_end(path)
+        return cached[2]
+
+    with _LOCK:
+        css = minify_css(path.read_text(encoding="utf-8"))
+        stylesheet = Stylesheet(css, hashlib.sha256(css.encode("utf-8")).hexdigest()[:12])
+        _CACHE[path] = (stat.st_mtime_ns, stat.st_size, stylesheet)
+        _CACHE.move_to_end(path)
+        while len(_CACHE) > _CACHE_SIZE:
+            _CACHE.popitem(last=False)
+    return stylesheet